@@ -8,15 +8,33 @@ for SLIT systems.
 __version__ = "1.0.0"
 __author__ = "SLIT Installer Team"
 
-# Import main components for easy access
-from .command import CommandExecutor, execute_command
-from .config import ConfigurationManager
-from .exceptions import InstallerError, ValidationError
-from .hardware import HardwareManager
-from .input import InputHandler, confirm, password, numeric, choice
-from .logging import get_logger, initialize_logging
-from .models import Drive, NetworkConfig, SystemConfig
-from .validation import validate_hostname, validate_ip_address, validate_username
+import importlib
+from typing import Any
+
+# Main components are imported on first access (PEP 562) so that importing
+# one helper does not pull in every submodule
+_LAZY = {
+    "CommandExecutor": ".command",
+    "execute_command": ".command",
+    "ConfigurationManager": ".config",
+    "InstallerError": ".exceptions",
+    "ValidationError": ".exceptions",
+    "ValidationIssue": ".exceptions",
+    "HardwareManager": ".hardware",
+    "InputHandler": ".input",
+    "confirm": ".input",
+    "password": ".input",
+    "numeric": ".input",
+    "choice": ".input",
+    "get_logger": ".logging",
+    "initialize_logging": ".logging",
+    "Drive": ".models",
+    "NetworkConfig": ".models",
+    "SystemConfig": ".models",
+    "validate_hostname": ".validation",
+    "validate_ip_address": ".validation",
+    "validate_username": ".validation",
+}
 
 __all__ = [
     "CommandExecutor",
@@ -24,6 +42,7 @@ __all__ = [
     "ConfigurationManager",
     "InstallerError",
     "ValidationError",
+    "ValidationIssue",
     "HardwareManager",
     "InputHandler",
     "confirm",
@@ -39,3 +58,28 @@ __all__ = [
     "validate_ip_address",
     "validate_username",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a main component on first access.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        The requested component
+
+    Raises:
+        AttributeError: If name is not a package component
+    """
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List public package components."""
+    return list(__all__)
@@ -7,7 +7,7 @@ and comprehensive error handling as specified in the utility functions.
 import subprocess
 import time
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 from .exceptions import CommandExecutionError
 from .logging import get_logger
@@ -302,6 +302,26 @@ class CommandExecutor:
                 e, cmd_list, description, duration, check_success
             )
 
+    def execute_script(
+        self, commands: Sequence[str], description: str, **kwargs
+    ) -> CommandResult:
+        """Execute a chain of shell commands in a single sh invocation.
+
+        Commands are joined with "&&", so the chain stops at the first
+        failure and the exit code is that of the failing command.
+
+        Args:
+            commands: Shell commands to run in order
+            description: Human-readable description for the whole chain
+            **kwargs: Additional arguments for execute_command
+
+        Returns:
+            CommandResult object for the chain
+        """
+        return self.execute_command(
+            ["sh", "-c", " && ".join(commands)], description, **kwargs
+        )
+
     def execute_command_with_progress(
         self,
         command: Union[str, List[str]],
@@ -380,6 +400,22 @@ def execute_command(
     return get_command_executor().execute_command(command, description, **kwargs)
 
 
+def execute_script(
+    commands: Sequence[str], description: str, **kwargs
+) -> CommandResult:
+    """Execute a chain of shell commands using global executor.
+
+    Args:
+        commands: Shell commands to run in order, stopping at the first failure
+        description: Human-readable description
+        **kwargs: Additional arguments for CommandExecutor.execute_command
+
+    Returns:
+        CommandResult object
+    """
+    return get_command_executor().execute_script(commands, description, **kwargs)
+
+
 def execute_command_with_progress(
     command: Union[str, List[str]],
     description: str,
@@ -6,19 +6,24 @@ file loading/saving, and comprehensive validation with corruption detection.
 
 from __future__ import annotations
 
-import json
+import codecs
+import copy
+import functools
+import locale
+import mmap
 import os
 import re
 import socket
 import subprocess
 import sys
-from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar, Dict, List, NoReturn, Optional
 
-from .exceptions import ValidationError
+from .exceptions import ValidationError, ValidationIssue
 from .hardware import HardwareManager
-from .input import confirm, password
 from .logging import get_logger
-from .models import NetworkConfig, SystemConfig
+from . import models
+from .models import Drive, NetworkConfig, SystemConfig
 from .validation import (
     validate_drive_path,
     validate_hostname,
@@ -27,10 +32,93 @@ from .validation import (
     validate_username,
 )
 
+# Parser for "ip route show default" output
+_RE_DEV = re.compile(r"dev\s+(\S+)")
+
+# Network type menu choices
+_NET_TYPE_TO_CHOICE = {"dhcp": "1", "static": "2", "manual": "3"}
+_CHOICE_TO_NET_TYPE = ("dhcp", "static", "manual")
+
+# Compiled locale data (per-locale directories and locale-archive)
+_LOCALE_DIR = "/usr/lib/locale"
+
+# Bytes sniffed by the configuration integrity check
+_INTEGRITY_PROBE_BYTES = 4096
+
+
+def _locale_is_compiled(name: str) -> bool:
+    """Check whether a locale has been generated on this system.
+
+    Locales are compiled either into their own directory or, on
+    Debian/Ubuntu, into the shared locale-archive, whose string table holds
+    each locale name NUL-terminated. A miss falls back to ``locale -a``.
+
+    Args:
+        name: Normalized locale name (e.g. "en_US.utf8")
+
+    Returns:
+        True if the locale's compiled data was found
+    """
+    if os.path.isdir(os.path.join(_LOCALE_DIR, name)):
+        return True
+
+    try:
+        with open(os.path.join(_LOCALE_DIR, "locale-archive"), "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as archive:
+                # Both NULs, so "en_US.utf8" does not match "xen_US.utf8"
+                return archive.find(b"\0" + name.encode() + b"\0") != -1
+    except (OSError, ValueError):
+        # Missing or empty archive (mmap rejects zero-length files)
+        return False
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_load(path: str, mtime_ns: int, size: int) -> SystemConfig:
+    """Load, parse and validate a configuration file once per file version.
+
+    The modification time and size are part of the cache key so an edited
+    file is re-read. Invalid files raise before anything is memoized.
+
+    Args:
+        path: Absolute path to configuration file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        Validated system configuration
+
+    Raises:
+        ValidationError: If file is corrupted or invalid
+    """
+    # models.JSON_DECODE_ERRORS imports json on first access; the except
+    # clause below is only evaluated once something has been raised
+    try:
+        # Check file integrity
+        ConfigurationManager._validate_config_file_integrity(path)
+
+        # Load configuration
+        config = SystemConfig.load_from_file(path)
+    except (
+        *models.JSON_DECODE_ERRORS,
+        UnicodeDecodeError,
+        FileNotFoundError,
+    ) as e:
+        ConfigurationManager._raise_unparsable(path, e)
+
+    # Validate configuration
+    errors = config.validate()
+    if errors:
+        ConfigurationManager._raise_invalid(path, errors)
+
+    return config
+
 
 class ConfigurationManager:
     """Manages interactive configuration prompts and file operations."""
 
+    # Auto-detected defaults shared by all instances, keyed by dry_run
+    _detected_cache: ClassVar[Dict[bool, SystemConfig]] = {}
+
     def __init__(self, dry_run: bool = False) -> None:
         """Initialize configuration manager.
 
@@ -93,35 +181,20 @@ class ConfigurationManager:
             ValidationError: If file is corrupted or invalid
         """
         try:
-            # Check file integrity
-            self._validate_config_file_integrity(config_file)
-
-            # Load configuration
-            config = SystemConfig.load_from_file(config_file)
-
-            # Validate configuration
-            errors = config.validate()
-            if errors:
-                error_messages = [f"  - {error.field}: {error.message}" for error in errors]
-                raise ValidationError(
-                    f"Configuration validation failed:\n" + "\n".join(error_messages),
-                    "configuration",
-                    config_file,
-                    "Valid configuration file",
-                )
-
-            self.logger.info(f"Configuration loaded successfully from {config_file}")
-            return config
-
-        except (json.JSONDecodeError, FileNotFoundError) as e:
-            raise ValidationError(
-                f"Failed to load configuration file: {e}",
-                "config_file",
-                config_file,
-                "Valid JSON configuration file",
-            )
+            st = os.stat(config_file)
+        except OSError as e:
+            self._raise_unreadable(config_file, e)
+
+        # Cached instances are shared, so hand out a private copy
+        config = copy.deepcopy(
+            _cached_load(os.path.abspath(config_file), st.st_mtime_ns, st.st_size)
+        )
+
+        self.logger.info(f"Configuration loaded successfully from {config_file}")
+        return config
 
-    def _validate_config_file_integrity(self, config_file: str) -> None:
+    @staticmethod
+    def _validate_config_file_integrity(config_file: str) -> None:
         """Validate configuration file integrity.
 
         Args:
@@ -131,45 +204,88 @@ class ConfigurationManager:
             ValidationError: If file is corrupted
         """
         try:
-            with open(config_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Check for empty file
-            if not content.strip():
-                raise ValidationError(
-                    "Configuration file is empty",
-                    "config_file",
-                    config_file,
-                    "Non-empty configuration file",
-                )
-
-            # Check for binary data
-            try:
-                content.encode("utf-8")
-            except UnicodeDecodeError:
-                raise ValidationError(
-                    "Configuration file contains binary data",
-                    "config_file",
-                    config_file,
-                    "Text configuration file",
-                )
-
-            # Check minimum length (should have some content)
-            if len(content) < 10:
-                raise ValidationError(
-                    "Configuration file appears truncated",
-                    "config_file",
-                    config_file,
-                    "Complete configuration file",
-                )
-
+            size = os.stat(config_file).st_size
+            with open(config_file, "rb") as f:
+                head = f.read(_INTEGRITY_PROBE_BYTES)
         except OSError as e:
-            raise ValidationError(
-                f"Cannot read configuration file: {e}",
-                "config_file",
-                config_file,
-                "Readable configuration file",
-            )
+            ConfigurationManager._raise_unreadable(config_file, e)
+
+        # Check for empty file
+        if not head.strip():
+            ConfigurationManager._raise_empty(config_file)
+
+        # Check for binary data (a multi-byte character may be cut at the end)
+        if b"\x00" in head:
+            ConfigurationManager._raise_binary(config_file)
+        try:
+            codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+        except UnicodeDecodeError:
+            ConfigurationManager._raise_binary(config_file)
+
+        # Check minimum length (should have some content)
+        if size < 10:
+            ConfigurationManager._raise_truncated(config_file)
+
+    @staticmethod
+    def _raise_unreadable(config_file: str, exc: OSError) -> NoReturn:
+        """Raise error for a configuration file that cannot be read."""
+        raise ValidationError(
+            f"Cannot read configuration file: {exc}",
+            "config_file",
+            config_file,
+            "Readable configuration file",
+        )
+
+    @staticmethod
+    def _raise_empty(config_file: str) -> NoReturn:
+        """Raise error for an empty configuration file."""
+        raise ValidationError(
+            "Configuration file is empty",
+            "config_file",
+            config_file,
+            "Non-empty configuration file",
+        )
+
+    @staticmethod
+    def _raise_binary(config_file: str) -> NoReturn:
+        """Raise error for a configuration file containing binary data."""
+        raise ValidationError(
+            "Configuration file contains binary data",
+            "config_file",
+            config_file,
+            "Text configuration file",
+        )
+
+    @staticmethod
+    def _raise_truncated(config_file: str) -> NoReturn:
+        """Raise error for a truncated configuration file."""
+        raise ValidationError(
+            "Configuration file appears truncated",
+            "config_file",
+            config_file,
+            "Complete configuration file",
+        )
+
+    @staticmethod
+    def _raise_unparsable(config_file: str, exc: Exception) -> NoReturn:
+        """Raise error for a configuration file that cannot be parsed."""
+        raise ValidationError(
+            f"Failed to load configuration file: {exc}",
+            "config_file",
+            config_file,
+            "Valid JSON configuration file",
+        )
+
+    @staticmethod
+    def _raise_invalid(config_file: str, errors: List[ValidationIssue]) -> NoReturn:
+        """Raise error listing every failed configuration field."""
+        error_messages = [f"  - {error.field}: {error.message}" for error in errors]
+        raise ValidationError(
+            f"Configuration validation failed:\n" + "\n".join(error_messages),
+            "configuration",
+            config_file,
+            "Valid configuration file",
+        )
 
     def _interactive_configuration(
         self, existing_config: Optional[SystemConfig] = None
@@ -210,7 +326,7 @@ class ConfigurationManager:
         network = self._prompt_network_configuration(defaults.network)
 
         # Get user password
-        password = self._prompt_password()
+        user_password = self._prompt_password()
 
         # Create configuration
         config = SystemConfig(
@@ -221,7 +337,7 @@ class ConfigurationManager:
             username=username,
             hostname=hostname,
             network=network,
-            user_password=password,
+            user_password=user_password,
             sudo_nopasswd=sudo_nopasswd,
         )
 
@@ -239,25 +355,36 @@ class ConfigurationManager:
         Returns:
             SystemConfig with detected defaults
         """
-        self.logger.info("Auto-detecting system settings...")
-
-        # Detect locale
-        locale = self._detect_locale()
-
-        # Detect timezone
-        timezone = self._detect_timezone()
+        detected = self._detected_cache.get(self.dry_run)
+        if detected is None:
+            self.logger.info("Auto-detecting system settings...")
+
+            # Detectors are independent and wait on I/O, so run them together
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                locale_future = executor.submit(self._detect_locale)
+                timezone_future = executor.submit(self._detect_timezone)
+                interface_future = executor.submit(self._detect_primary_interface)
+
+                locale = locale_future.result()
+                timezone = timezone_future.result()
+                interface = interface_future.result()
+
+            # Create default network config
+            network = NetworkConfig(network_type="dhcp", interface=interface)
+
+            detected = SystemConfig(
+                locale=locale,
+                timezone=timezone,
+                network=network,
+            )
+            self._detected_cache[self.dry_run] = detected
 
-        # Detect network interface
-        interface = self._detect_primary_interface()
+        return copy.deepcopy(detected)
 
-        # Create default network config
-        network = NetworkConfig(network_type="dhcp", interface=interface)
-
-        return SystemConfig(
-            locale=locale,
-            timezone=timezone,
-            network=network,
-        )
+    @classmethod
+    def invalidate_detection(cls) -> None:
+        """Discard cached auto-detected settings so the next call re-detects."""
+        cls._detected_cache.clear()
 
     def _detect_locale(self) -> str:
         """Detect system locale.
@@ -267,12 +394,32 @@ class ConfigurationManager:
         """
         try:
             # Try environment variables
-            for var in ["LC_ALL", "LC_CTYPE", "LANG"]:
-                locale = os.environ.get(var, "")
-                if locale and validate_locale(locale):
-                    return locale
+            env = os.environ
+            env_locale = next(
+                (
+                    value
+                    for value in (env.get("LC_ALL"), env.get("LC_CTYPE"), env.get("LANG"))
+                    if value and validate_locale(value)
+                ),
+                None,
+            )
+            if env_locale:
+                return env_locale
+
+            # Try the locale of the running interpreter; getlocale() raises
+            # ValueError for locale names it cannot parse
+            try:
+                language, encoding = locale.getlocale()
+            except ValueError:
+                language = encoding = None
+            if language == "en_US" and encoding == "UTF-8":
+                return "en_US.UTF-8"
+
+            # Probe compiled locale data directly instead of running locale -a
+            if _locale_is_compiled("en_US.utf8"):
+                return "en_US.UTF-8"
 
-            # Try locale command
+            # Fall back to locale command
             result = subprocess.run(
                 ["locale", "-a"], capture_output=True, text=True, timeout=5
             )
@@ -323,6 +470,11 @@ class ConfigurationManager:
         Returns:
             Primary network interface name
         """
+        # Read kernel routing and interface tables directly on Linux
+        interface = self._read_default_route_interface() or self._read_first_up_interface()
+        if interface:
+            return interface
+
         try:
             # Get default route interface
             result = subprocess.run(
@@ -330,27 +482,70 @@ class ConfigurationManager:
             )
             if result.returncode == 0:
                 # Parse output: "default via X.X.X.X dev interface ..."
-                match = re.search(r"dev\s+(\S+)", result.stdout)
+                match = _RE_DEV.search(result.stdout)
                 if match:
                     return match.group(1)
 
-            # Fallback: get first non-loopback interface
-            result = subprocess.run(
-                ["ip", "link", "show"], capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0:
-                for line in result.stdout.splitlines():
-                    match = re.search(r"^\d+:\s+(\S+):", line)
-                    if match:
-                        interface = match.group(1)
-                        if interface != "lo" and not interface.startswith("lo"):
-                            return interface
-
         except (subprocess.TimeoutExpired, FileNotFoundError):
             pass
 
+        # Fallback: get first non-loopback interface
+        try:
+            for _, name in socket.if_nameindex():
+                if not name.startswith("lo"):
+                    return name
+        except OSError:
+            pass
+
         return "eth0"
 
+    @staticmethod
+    def _read_default_route_interface() -> str:
+        """Find the default route interface in /proc/net/route.
+
+        Returns:
+            Interface name, or empty string if not found
+        """
+        try:
+            with open("/proc/net/route", "r", encoding="ascii") as f:
+                next(f, None)  # Skip header
+                for line in f:
+                    fields = line.split("\t")
+                    if len(fields) < 4:
+                        continue
+                    # Default route has destination 0.0.0.0 and RTF_UP|RTF_GATEWAY set
+                    flags = int(fields[3], 16)
+                    if fields[1] == "00000000" and flags & 0x0003 == 0x0003:
+                        return fields[0]
+        except (OSError, ValueError):
+            pass
+
+        return ""
+
+    @staticmethod
+    def _read_first_up_interface() -> str:
+        """Find the first non-loopback interface that is up in sysfs.
+
+        Returns:
+            Interface name, or empty string if not found
+        """
+        try:
+            names = sorted(os.listdir("/sys/class/net"))
+        except OSError:
+            return ""
+
+        for name in names:
+            if name.startswith("lo"):
+                continue
+            try:
+                with open(f"/sys/class/net/{name}/operstate", "r", encoding="ascii") as f:
+                    if f.read().strip() == "up":
+                        return name
+            except OSError:
+                continue
+
+        return ""
+
     def _prompt_locale(self, default: str) -> str:
         """Prompt for system locale.
 
@@ -360,8 +555,8 @@ class ConfigurationManager:
         Returns:
             Selected locale
         """
+        prompt = f"System locale [{default}]: "
         while True:
-            prompt = f"System locale [{default}]: "
             locale = input(prompt).strip() or default
 
             if validate_locale(locale):
@@ -379,8 +574,8 @@ class ConfigurationManager:
         Returns:
             Selected timezone
         """
+        prompt = f"System timezone [{default}]: "
         while True:
-            prompt = f"System timezone [{default}]: "
             timezone = input(prompt).strip() or default
 
             if validate_timezone(timezone):
@@ -398,9 +593,9 @@ class ConfigurationManager:
         Returns:
             User's full name
         """
+        default_display = default or "KDE User"
+        prompt = f"User full name [{default_display}]: "
         while True:
-            default_display = default or "KDE User"
-            prompt = f"User full name [{default_display}]: "
             fullname = input(prompt).strip() or default_display
 
             if fullname:
@@ -417,8 +612,8 @@ class ConfigurationManager:
         Returns:
             Selected username
         """
+        prompt = f"Username{f' [{default}]' if default else ''}: "
         while True:
-            prompt = f"Username{f' [{default}]' if default else ''}: "
             username = input(prompt).strip() or default
 
             if not username:
@@ -442,6 +637,8 @@ class ConfigurationManager:
         Returns:
             True if passwordless sudo should be enabled
         """
+        from .input import confirm
+
         return confirm("Add user to passwordless sudo? ", default=default)
 
     def _prompt_hostname(self, default: str) -> str:
@@ -453,8 +650,8 @@ class ConfigurationManager:
         Returns:
             Selected hostname
         """
+        prompt = f"Hostname{f' [{default}]' if default else ''}: "
         while True:
-            prompt = f"Hostname{f' [{default}]' if default else ''}: "
             hostname = input(prompt).strip() or default
 
             if not hostname:
@@ -491,6 +688,8 @@ class ConfigurationManager:
         
         # Filter safe drives (no Windows by default)
         safe_drives = self.hardware_manager.filter_safe_drives(all_drives, show_windows=False)
+        safe_paths = {d.path for d in safe_drives}
+        drives_by_path = {d.path: d for d in all_drives}
         
         # Show all drives with safety information
         print("\nAvailable drives:")
@@ -504,7 +703,7 @@ class ConfigurationManager:
                 status_icons.append("⚠️  Too small")
                 
             status_str = f" ({', '.join(status_icons)})" if status_icons else ""
-            suitable = "✅" if drive in safe_drives else "❌"
+            suitable = "✅" if drive.path in safe_paths else "❌"
             
             print(f"  {i}. {suitable} {drive}{status_str}")
         
@@ -515,40 +714,41 @@ class ConfigurationManager:
             print("   Installing on these drives may destroy Windows!")
         
         # Get user selection
+        default_valid = bool(default) and validate_drive_path(default)
+        if default_valid:
+            prompt = f"Select drive (1-{len(all_drives)}) [{default}]: "
+        else:
+            prompt = f"Select drive (1-{len(all_drives)}): "
+
         while True:
-            if default and validate_drive_path(default):
-                prompt = f"Select drive (1-{len(all_drives)}) [{default}]: "
-            else:
-                prompt = f"Select drive (1-{len(all_drives)}): "
-                
             choice = input(prompt).strip()
             
             # Handle default
             if not choice and default:
-                return self._validate_drive_choice(default, all_drives)
+                return self._validate_drive_choice(default, drives_by_path)
             
             # Handle numeric selection
             try:
                 selection = int(choice)
                 if 1 <= selection <= len(all_drives):
                     selected_drive = all_drives[selection - 1]
-                    return self._validate_drive_choice(selected_drive.path, all_drives)
+                    return self._validate_drive_choice(selected_drive.path, drives_by_path)
                 else:
                     print(f"✗ Please enter a number between 1 and {len(all_drives)}")
             except ValueError:
                 print("✗ Please enter a valid number")
 
-    def _validate_drive_choice(self, drive_path: str, all_drives: list) -> str:
+    def _validate_drive_choice(self, drive_path: str, drives_by_path: Dict[str, Drive]) -> str:
         """Validate and confirm drive choice.
 
         Args:
             drive_path: Selected drive path
-            all_drives: List of all available drives
+            drives_by_path: All available drives keyed by device path
 
         Returns:
             Confirmed drive path
         """
-        drive = self.hardware_manager.get_drive_by_path(all_drives, drive_path)
+        drive = drives_by_path.get(drive_path)
         
         if not drive:
             print(f"✗ Drive {drive_path} not found")
@@ -583,8 +783,8 @@ class ConfigurationManager:
         print("\n💭 Manual drive entry mode")
         print("   (Automatic detection unavailable)")
         
+        prompt = f"Enter drive path{f' [{default}]' if default else ''}: "
         while True:
-            prompt = f"Enter drive path{f' [{default}]' if default else ''}: "
             drive = input(prompt).strip() or default
 
             if not drive:
@@ -615,24 +815,16 @@ class ConfigurationManager:
         print("  2. Static IP")
         print("  3. Manual (configure after installation)")
 
+        current_type = _NET_TYPE_TO_CHOICE.get(default.network_type, "1")
+        prompt = f"Network type [1-3, default {current_type}]: "
         while True:
-            current_type = {"dhcp": "1", "static": "2", "manual": "3"}.get(
-                default.network_type, "1"
-            )
-            prompt = f"Network type [1-3, default {current_type}]: "
             choice = input(prompt).strip() or current_type
 
-            if choice == "1":
-                network_type = "dhcp"
-                break
-            elif choice == "2":
-                network_type = "static"
-                break
-            elif choice == "3":
-                network_type = "manual"
+            if choice in ("1", "2", "3"):
+                network_type = _CHOICE_TO_NET_TYPE[int(choice) - 1]
                 break
-            else:
-                print("✗ Please enter 1, 2, or 3")
+
+            print("✗ Please enter 1, 2, or 3")
 
         # Interface
         interface = input(f"Network interface [{default.interface}]: ").strip() or default.interface
@@ -659,8 +851,8 @@ class ConfigurationManager:
         print("-" * 25)
 
         # Get IP address
+        prompt = f"IP address{f' [{default.ip_address}]' if default.ip_address else ''}: "
         while True:
-            prompt = f"IP address{f' [{default.ip_address}]' if default.ip_address else ''}: "
             ip_address = input(prompt).strip() or default.ip_address
 
             if not ip_address:
@@ -676,8 +868,8 @@ class ConfigurationManager:
             netmask = default.netmask or "255.255.255.0"
 
         # Get gateway
+        prompt = f"Gateway{f' [{default.gateway}]' if default.gateway else ''}: "
         while True:
-            prompt = f"Gateway{f' [{default.gateway}]' if default.gateway else ''}: "
             gateway = input(prompt).strip() or default.gateway
 
             if not gateway:
@@ -725,6 +917,8 @@ class ConfigurationManager:
         Returns:
             User password
         """
+        from .input import password
+
         print("\nUser Account")
         print("-" * 15)
 
@@ -778,6 +972,8 @@ class ConfigurationManager:
         Returns:
             True if user wants to edit
         """
+        from .input import confirm
+
         return confirm("Edit existing configuration? ", default=False)
 
     def _prompt_delete_corrupted_config(self, config_file: str) -> bool:
@@ -789,6 +985,8 @@ class ConfigurationManager:
         Returns:
             True if user wants to delete
         """
+        from .input import confirm
+
         print(f"\nConfiguration file '{config_file}' is corrupted or invalid.")
         return confirm("Delete corrupted file and start fresh? ", default=False)
 
@@ -798,6 +996,8 @@ class ConfigurationManager:
         Returns:
             True if user wants to save
         """
+        from .input import confirm
+
         return confirm("\nSave configuration for future use? ", default=True)
 
     def _display_header(self, title: str) -> None:
@@ -4,7 +4,7 @@ This module defines all custom exception classes used throughout the installer,
 following the error handling framework specified in the utility functions.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, NamedTuple, Optional
 
 
 class InstallerError(Exception):
@@ -75,6 +75,25 @@ class ValidationError(InstallerError):
         self.expected_format = expected_format
 
 
+class ValidationIssue(NamedTuple):
+    """A single failed validation check, collected without raising.
+
+    Validators return these plain records; ConfigurationManager raises a
+    single ValidationError summarizing them.
+
+    Attributes:
+        message: Error description
+        field: Field that failed validation
+        invalid_value: The invalid value
+        expected_format: Description of expected format
+    """
+
+    message: str
+    field: str
+    invalid_value: Any
+    expected_format: str
+
+
 class CommandExecutionError(InstallerError):
     """Command execution errors."""
 
@@ -6,15 +6,222 @@ validation functionality for safe system installation.
 
 from __future__ import annotations
 
+import functools
 import os
 import re
 import subprocess
-from typing import List, Optional, Tuple
+import time
+import warnings
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 from .exceptions import ValidationError
 from .logging import get_logger
 from .models import Drive, WindowsDetectionResult
 
+# Block devices in sysfs; whole disks backed by hardware have a "device"
+# link, while partitions, loop, dm, md and zram devices do not
+_SYSFS_BLOCK = "/sys/class/block"
+# Optical drives also have a device link but are never install targets
+_SYSFS_OPTICAL_RE = re.compile(r"^sr\d+$")
+
+# Bytes per reported gigabyte; sizes are binary (GiB) to match the kernel
+_BYTES_PER_GB = 1024 ** 3
+
+# Discovery commands feeding Windows detection
+_BLKID_EXPORT_ARGV = ("blkid", "-o", "export")
+_EFIBOOTMGR_ARGV = ("efibootmgr", "-v")
+
+# Seconds that cached discovery command output stays valid
+_BLKID_TTL = 5.0
+_EFIBOOTMGR_TTL = 30.0
+
+# Smallest drive offered as an installation target
+_MIN_DRIVE_SIZE_GB = 20
+
+# Keywords marking Windows-related EFI boot entries
+# ("bootmgfw" is the Windows Boot Manager loader, bootmgfw.efi)
+_EFI_WIN_KEYWORDS = r"windows|microsoft|bootmgfw"
+# Whole lines containing a keyword, found in one pass over the output
+_EFI_WIN_RE = re.compile(
+    rf"^.*(?:{_EFI_WIN_KEYWORDS}).*$", re.IGNORECASE | re.MULTILINE
+)
+
+# Dry-run fixtures, largest drive first; both models are frozen, so the
+# instances are shared by every caller
+_MOCK_DRIVES: Tuple[Drive, ...] = (
+    Drive(
+        path="/dev/nvme1n1",
+        size_gb=1000,
+        model="WD Black SN750 1TB",
+        is_removable=False,
+        has_windows=True  # Mock Windows drive for testing
+    ),
+    Drive(
+        path="/dev/nvme0n1",
+        size_gb=500,
+        model="Samsung SSD 980 500GB",
+        is_removable=False,
+        has_windows=False
+    ),
+    Drive(
+        path="/dev/sda",
+        size_gb=250,
+        model="Crucial MX250 250GB",
+        is_removable=False,
+        has_windows=False
+    ),
+)
+_MOCK_WDR_YES = WindowsDetectionResult(
+    has_windows=True,
+    confidence_level="high",
+    detection_methods=("NTFS filesystem", "Windows EFI entries"),
+    windows_version="Windows 11",
+    boot_entries=("Boot0001: Windows Boot Manager",)
+)
+_MOCK_WDR_NO = WindowsDetectionResult(
+    has_windows=False,
+    confidence_level="high",
+    detection_methods=("No Windows indicators found",)
+)
+
+
+def _read_sysfs_value(path: str) -> str:
+    """Read a single sysfs attribute.
+
+    Args:
+        path: Attribute file path
+
+    Returns:
+        Stripped attribute value, empty if unreadable
+    """
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def _is_partition_of(device_path: str, drive_path: str) -> bool:
+    """Check whether a device path names a partition of a drive.
+
+    Args:
+        device_path: Device path, e.g. "/dev/nvme0n1p2"
+        drive_path: Drive path, e.g. "/dev/nvme0n1"
+
+    Returns:
+        True if device_path is a numbered partition of drive_path
+    """
+    if not device_path.startswith(drive_path):
+        return False
+    suffix = device_path[len(drive_path):]
+    # Drives whose name ends in a digit (nvme0n1, mmcblk0) use a "p" separator
+    if drive_path[-1:].isdigit():
+        if not suffix.startswith("p"):
+            return False
+        suffix = suffix[1:]
+    return suffix.isdigit()
+
+
+def _partition_path(drive_path: str, number: int) -> str:
+    """Build the device path of a drive's numbered partition.
+
+    Args:
+        drive_path: Drive path, e.g. "/dev/sda" or "/dev/nvme0n1"
+        number: Partition number, starting at 1
+
+    Returns:
+        Partition path, e.g. "/dev/sda1" or "/dev/nvme0n1p1"
+    """
+    # Same naming rule _is_partition_of checks
+    separator = "p" if drive_path[-1:].isdigit() else ""
+    return f"{drive_path}{separator}{number}"
+
+
+def _list_partitions(drive_path: str) -> Optional[List[str]]:
+    """List a drive's partitions from sysfs.
+
+    Args:
+        drive_path: Drive path, e.g. "/dev/nvme0n1"
+
+    Returns:
+        Sorted partition device paths, or None if the drive is not in sysfs
+    """
+    name = os.path.basename(drive_path)
+    try:
+        with os.scandir(f"{_SYSFS_BLOCK}/{name}") as entries:
+            partitions = [
+                f"/dev/{entry.name}" for entry in entries
+                if _is_partition_of(f"/dev/{entry.name}", drive_path)
+            ]
+    except OSError:
+        return None
+    return sorted(partitions)
+
+
+def _parse_blkid_export(output: str) -> Dict[str, Dict[str, str]]:
+    """Parse "blkid -o export" output.
+
+    Args:
+        output: Blank-line separated blocks of KEY=value lines
+
+    Returns:
+        Fields of each device keyed by its DEVNAME
+    """
+    devices = {}
+    for block in output.split("\n\n"):
+        fields = {}
+        for line in block.splitlines():
+            key, sep, value = line.partition("=")
+            if sep:
+                # Values are shell-escaped, e.g. "Basic\ data\ partition"
+                fields[key] = value.replace("\\", "")
+        devname = fields.get("DEVNAME")
+        if devname:
+            devices[devname] = fields
+    return devices
+
+
+def _is_microsoft_partition(fields: Dict[str, str]) -> bool:
+    """Check whether blkid fields carry a Microsoft GPT partition label.
+
+    Args:
+        fields: blkid fields of one partition
+
+    Returns:
+        True if PARTLABEL names a Microsoft partition
+    """
+    return "microsoft" in fields.get("PARTLABEL", "").lower()
+
+
+@functools.lru_cache(maxsize=32)
+def _efi_drive_pattern(device_name: str) -> re.Pattern:
+    """Build a pattern matching a Windows EFI entry line that names a device.
+
+    Args:
+        device_name: Device name without "/dev/", e.g. "nvme0n1"
+
+    Returns:
+        Compiled pattern; "." does not cross lines, so one search over the
+        whole efibootmgr output checks every entry in a single pass
+    """
+    name = re.escape(device_name)
+    return re.compile(
+        rf"(?:{_EFI_WIN_KEYWORDS}).*{name}|{name}.*(?:{_EFI_WIN_KEYWORDS})",
+        re.IGNORECASE,
+    )
+
+
+def _index_drives(drives: List[Drive]) -> Dict[str, Drive]:
+    """Index drives by device path.
+
+    Args:
+        drives: Drives to index
+
+    Returns:
+        Mapping of device path to drive
+    """
+    return {drive.path: drive for drive in drives}
+
 
 class HardwareManager:
     """Manages hardware detection and drive enumeration."""
@@ -27,6 +234,113 @@ class HardwareManager:
         """
         self.dry_run = dry_run
         self.logger = get_logger(__name__)
+        self._command_cache: Dict[
+            Tuple[str, ...], Tuple[float, subprocess.CompletedProcess]
+        ] = {}
+        self._wdr_cache: Dict[str, WindowsDetectionResult] = {}
+        self._drive_index: Dict[str, Drive] = {}
+
+    def _run(
+        self, argv: Sequence[str], timeout: float = 5.0
+    ) -> subprocess.CompletedProcess:
+        """Run a discovery command and capture its raw output.
+
+        Output is left as bytes; the discovery tools print ASCII, so callers
+        decode only what they parse.
+
+        Args:
+            argv: Command and arguments
+            timeout: Seconds before the command is abandoned
+
+        Returns:
+            Completed process with bytes stdout/stderr; a non-zero exit
+            status is not raised
+
+        Raises:
+            subprocess.TimeoutExpired: If the command does not finish in time
+        """
+        return subprocess.run(
+            argv, capture_output=True, timeout=timeout, check=False
+        )
+
+    def _run_cached(
+        self, argv: Tuple[str, ...], ttl: float = 5.0
+    ) -> subprocess.CompletedProcess:
+        """Run a read-only discovery command, reusing recent output.
+
+        Args:
+            argv: Command and arguments
+            ttl: Seconds a previous result stays valid
+
+        Returns:
+            Completed process, possibly from cache
+        """
+        now = time.monotonic()
+        cached = self._command_cache.get(argv)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+
+        result = self._run(argv)
+        self._command_cache[argv] = (now, result)
+        return result
+
+    def _start_cached(
+        self, argv: Tuple[str, ...], ttl: float = 5.0
+    ) -> Optional[subprocess.Popen]:
+        """Start a discovery command in the background unless cached.
+
+        Args:
+            argv: Command and arguments
+            ttl: Seconds a previous result stays valid
+
+        Returns:
+            Running process to pass to _finish_cached, or None if a fresh
+            result is cached or the command cannot be started
+        """
+        cached = self._command_cache.get(argv)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return None
+
+        try:
+            return subprocess.Popen(
+                argv, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+        except OSError as e:
+            self.logger.debug(f"Could not start {argv[0]}: {e}")
+            return None
+
+    def _finish_cached(
+        self, argv: Tuple[str, ...], proc: subprocess.Popen, timeout: float = 5.0
+    ) -> None:
+        """Wait for a command from _start_cached and cache its result.
+
+        A command that times out is killed and cached as failed, so later
+        lookups do not wait on it again.
+
+        Args:
+            argv: Command and arguments the process was started with
+            proc: Running process
+            timeout: Seconds to wait for the process
+        """
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+            returncode = proc.returncode
+        except subprocess.TimeoutExpired:
+            self.logger.debug(f"{argv[0]} timed out")
+            proc.kill()
+            proc.communicate()
+            stdout, stderr, returncode = b"", b"", -1
+
+        result = subprocess.CompletedProcess(argv, returncode, stdout, stderr)
+        self._command_cache[argv] = (time.monotonic(), result)
+
+    def clear_cache(self) -> None:
+        """Discard cached command output.
+
+        Call after anything that changes partitions or boot entries.
+        """
+        self._command_cache.clear()
+        self._wdr_cache.clear()
 
     def enumerate_drives(self, include_removable: bool = False) -> List[Drive]:
         """Enumerate available storage drives.
@@ -35,162 +349,185 @@ class HardwareManager:
             include_removable: Include removable drives in results
 
         Returns:
-            List of detected drives
+            List of detected drives, largest first
         """
         self.logger.info("Enumerating storage drives")
         
         if self.dry_run:
-            return self._get_mock_drives()
+            drives = self._get_mock_drives()
+            self._drive_index = _index_drives(drives)
+            return drives
 
         drives = []
         
         try:
-            # Get all block devices
-            result = subprocess.run(
-                ["lsblk", "-dpno", "NAME,SIZE,MODEL,TYPE"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if result.returncode != 0:
-                self.logger.error(f"lsblk failed: {result.stderr}")
-                return drives
+            # Windows detection inputs are queried once for all drives; both
+            # commands run concurrently while block devices are scanned
+            pending = [
+                (argv, self._start_cached(argv, ttl))
+                for argv, ttl in (
+                    (_BLKID_EXPORT_ARGV, _BLKID_TTL),
+                    (_EFIBOOTMGR_ARGV, _EFIBOOTMGR_TTL),
+                )
+            ]
 
-            for line in result.stdout.strip().split('\n'):
-                if not line.strip():
-                    continue
-                    
-                parts = line.split()
-                if len(parts) < 4:
-                    continue
-                    
-                device_path = parts[0]
-                size_str = parts[1]
-                model = " ".join(parts[2:-1]) if len(parts) > 4 else parts[2]
-                device_type = parts[-1]
-                
-                # Check removable status separately
-                removable = self._check_removable(device_path)
-                
-                # Filter for actual drives (not partitions)
-                if device_type != "disk":
-                    continue
-                    
+            try:
+                # Read drives from sysfs, falling back to lsblk
+                candidates = (
+                    self._scan_sysfs_drives() or self._scan_lsblk_drives()
+                )
+            finally:
+                # Reap the background commands even if the scan raised, so
+                # they do not outlive enumeration as zombies
+                for argv, proc in pending:
+                    if proc is not None:
+                        self._finish_cached(argv, proc)
+
+            block_devices = self._read_block_devices()
+            efi_output = self._read_efi_boot_entries()
+
+            for device_path, size_gb, model, removable in candidates:
                 # Skip removable drives unless explicitly requested
                 if removable and not include_removable:
                     continue
-                    
-                # Parse size (convert from human readable)
-                size_gb = self._parse_size_to_gb(size_str)
-                
-                # Create drive object
-                drive = Drive(
-                    path=device_path,
-                    size_gb=size_gb,
-                    model=model,
-                    is_removable=removable
+
+                # Check for Windows installation, only on drives that could be
+                # offered as a target
+                has_windows = (
+                    not removable
+                    and size_gb >= _MIN_DRIVE_SIZE_GB
+                    and self._detect_windows_on_drive(
+                        device_path, block_devices, efi_output
+                    )
+                )
+
+                drives.append(
+                    Drive(
+                        path=device_path,
+                        size_gb=size_gb,
+                        model=model,
+                        is_removable=removable,
+                        has_windows=has_windows,
+                    )
                 )
-                
-                # Check for Windows installation
-                drive.has_windows = self._detect_windows_on_drive(drive.path)
-                
-                drives.append(drive)
                 
         except subprocess.TimeoutExpired:
             self.logger.error("Drive enumeration timed out")
         except Exception as e:
             self.logger.error(f"Drive enumeration failed: {e}")
             
+        # Largest first, so callers wanting one drive can stop at the first hit
+        drives.sort(key=lambda d: d.size_gb, reverse=True)
+
         self.logger.info(f"Found {len(drives)} suitable drives")
+        self._drive_index = _index_drives(drives)
         return drives
 
-    def _check_removable(self, device_path: str) -> bool:
-        """Check if device is removable.
-
-        Args:
-            device_path: Device path to check
+    def _scan_sysfs_drives(self) -> List[Tuple[str, int, str, bool]]:
+        """Read whole-disk block devices directly from sysfs.
 
         Returns:
-            True if device is removable
+            List of (path, size_gb, model, removable) tuples, empty if sysfs
+            is unavailable or holds no hardware-backed disks
         """
+        candidates = []
+
         try:
-            device_name = device_path.replace("/dev/", "")
-            removable_path = f"/sys/class/block/{device_name}/removable"
-            
-            if os.path.exists(removable_path):
-                with open(removable_path, 'r') as f:
-                    return f.read().strip() == "1"
-        except Exception:
-            pass
-            
-        return False
+            entries = sorted(os.scandir(_SYSFS_BLOCK), key=lambda e: e.name)
+        except OSError:
+            return candidates
+
+        for entry in entries:
+            base = entry.path
+            # Test for a backing device rather than matching name prefixes,
+            # so xvd, hd and other disk classes are not silently dropped
+            if (
+                not os.path.exists(f"{base}/device")
+                or os.path.exists(f"{base}/partition")
+                or _SYSFS_OPTICAL_RE.match(entry.name)
+            ):
+                continue
 
-    def _get_mock_drives(self) -> List[Drive]:
-        """Get mock drives for dry-run testing.
+            try:
+                sectors = int(_read_sysfs_value(f"{base}/size") or 0)
+            except ValueError:
+                continue
+            size_gb = sectors * 512 // _BYTES_PER_GB
+            model = _read_sysfs_value(f"{base}/device/model") or "Unknown"
+            removable = _read_sysfs_value(f"{base}/removable") == "1"
+
+            candidates.append((f"/dev/{entry.name}", size_gb, model, removable))
+
+        return candidates
+
+    def _scan_lsblk_drives(self) -> List[Tuple[str, int, str, bool]]:
+        """List whole-disk block devices with lsblk.
 
         Returns:
-            List of mock drives for testing
+            List of (path, size_gb, model, removable) tuples
+
+        Raises:
+            subprocess.TimeoutExpired: If lsblk does not finish in time
         """
-        return [
-            Drive(
-                path="/dev/nvme0n1",
-                size_gb=500,
-                model="Samsung SSD 980 500GB",
-                is_removable=False,
-                has_windows=False
-            ),
-            Drive(
-                path="/dev/nvme1n1", 
-                size_gb=1000,
-                model="WD Black SN750 1TB",
-                is_removable=False,
-                has_windows=True  # Mock Windows drive for testing
-            ),
-            Drive(
-                path="/dev/sda",
-                size_gb=250,
-                model="Crucial MX250 250GB",
-                is_removable=False,
-                has_windows=False
+        candidates = []
+
+        result = self._run(["lsblk", "-dbpno", "NAME,SIZE,MODEL,RM,TYPE"], timeout=10)
+
+        if result.returncode != 0:
+            self.logger.error(
+                f"lsblk failed: {result.stderr.decode('ascii', 'replace')}"
             )
-        ]
+            return candidates
 
-    def _parse_size_to_gb(self, size_str: str) -> int:
-        """Parse lsblk size string to GB.
+        for raw in result.stdout.splitlines():
+            parts = raw.decode("ascii", "replace").split()
+            if len(parts) < 4:
+                continue
 
-        Args:
-            size_str: Size string like "500G", "1.5T", "256M"
+            device_path = parts[0]
+            try:
+                size_gb = int(parts[1]) // _BYTES_PER_GB
+            except ValueError:
+                size_gb = 0
+            model = " ".join(parts[2:-2]) or "Unknown"
+            removable = parts[-2] == "1"
+            device_type = parts[-1]
+
+            # Filter for actual drives (not partitions)
+            if device_type != "disk":
+                continue
+
+            candidates.append(
+                (
+                    device_path,
+                    size_gb,
+                    model,
+                    removable,
+                )
+            )
+
+        return candidates
+
+    def _get_mock_drives(self) -> List[Drive]:
+        """Get mock drives for dry-run testing.
 
         Returns:
-            Size in gigabytes
+            New list over the shared, immutable mock drives, largest first
         """
-        size_str = size_str.upper().strip()
-        
-        # Extract number and unit
-        match = re.match(r"^([\d.]+)([KMGT]?)$", size_str)
-        if not match:
-            return 0
-            
-        number = float(match.group(1))
-        unit = match.group(2)
-        
-        # Convert to GB
-        multipliers = {
-            "": 1,       # Assume bytes if no unit
-            "K": 1e-6,   # KB to GB  
-            "M": 1e-3,   # MB to GB
-            "G": 1,      # GB to GB
-            "T": 1000    # TB to GB
-        }
-        
-        return int(number * multipliers.get(unit, 1))
-
-    def _detect_windows_on_drive(self, drive_path: str) -> bool:
+        return list(_MOCK_DRIVES)
+
+    def _detect_windows_on_drive(
+        self,
+        drive_path: str,
+        block_devices: Dict[str, Dict[str, str]],
+        efi_output: str,
+    ) -> bool:
         """Detect Windows installation on a drive.
 
         Args:
             drive_path: Path to drive to check
+            block_devices: blkid fields of all block devices, keyed by path
+            efi_output: Output of "efibootmgr -v"
 
         Returns:
             True if Windows detected
@@ -198,75 +535,115 @@ class HardwareManager:
         if self.dry_run:
             # Mock Windows detection for testing
             return "nvme1n1" in drive_path
-            
-        try:
-            # Check for NTFS partitions
-            result = subprocess.run(
-                ["blkid", "-o", "value", "-s", "TYPE", f"{drive_path}*"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            if "ntfs" in result.stdout.lower():
+
+        # Check for NTFS or Microsoft-labelled partitions
+        for device, fields in block_devices.items():
+            if not _is_partition_of(device, drive_path):
+                continue
+            if fields.get("TYPE") == "ntfs":
                 self.logger.info(f"NTFS partition found on {drive_path}")
                 return True
-                
-            # Check for Windows EFI entries
-            if self._check_windows_efi_entries(drive_path):
+            if _is_microsoft_partition(fields):
+                self.logger.info(f"Microsoft partition found on {drive_path}")
                 return True
-                
+
+        # Check for Windows EFI entries
+        return self._check_windows_efi_entries(drive_path, efi_output)
+
+    def _read_block_devices(
+        self, devices: Tuple[str, ...] = ()
+    ) -> Dict[str, Dict[str, str]]:
+        """Read block device metadata with a single blkid call.
+
+        Args:
+            devices: Devices to probe; all known devices if empty
+
+        Returns:
+            blkid fields (TYPE, LABEL, PARTLABEL, ...) keyed by device path
+        """
+        try:
+            result = self._run_cached((*_BLKID_EXPORT_ARGV, *devices), ttl=_BLKID_TTL)
+            return _parse_blkid_export(result.stdout.decode("utf-8", "replace"))
         except Exception as e:
-            self.logger.debug(f"Windows detection failed for {drive_path}: {e}")
-            
-        return False
+            self.logger.debug(f"blkid query failed: {e}")
+            return {}
 
-    def _check_windows_efi_entries(self, drive_path: str) -> bool:
-        """Check for Windows-related EFI boot entries.
+    def _drive_partition_fields(self, drive_path: str) -> List[Dict[str, str]]:
+        """Get blkid fields for each partition of a drive.
 
         Args:
-            drive_path: Drive path to check
+            drive_path: Drive path to inspect
 
         Returns:
-            True if Windows EFI entries found
+            blkid fields of the drive's partitions
+        """
+        partitions = _list_partitions(drive_path)
+        if partitions is not None:
+            # Probe only this drive's partitions; none means nothing to spawn
+            if not partitions:
+                return []
+            return list(self._read_block_devices(tuple(partitions)).values())
+
+        return [
+            fields for device, fields in self._read_block_devices().items()
+            if _is_partition_of(device, drive_path)
+        ]
+
+    def _read_efi_boot_entries(self) -> str:
+        """Read EFI boot entries.
+
+        Returns:
+            Output of "efibootmgr -v", empty if unavailable
         """
         try:
-            result = subprocess.run(
-                ["efibootmgr", "-v"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            if result.returncode != 0:
-                return False
-                
-            # Look for Windows entries that reference this drive
-            for line in result.stdout.splitlines():
-                if any(keyword in line.lower() for keyword in ["windows", "microsoft"]):
-                    # Check if the entry references our drive
-                    if drive_path.replace("/dev/", "") in line:
-                        return True
-                        
+            result = self._run_cached(_EFIBOOTMGR_ARGV, ttl=_EFIBOOTMGR_TTL)
+            if result.returncode == 0:
+                return result.stdout.decode("ascii", "replace")
         except Exception as e:
             self.logger.debug(f"EFI check failed: {e}")
-            
-        return False
 
-    def get_drive_by_path(self, drives: List[Drive], path: str) -> Optional[Drive]:
-        """Get drive object by path.
+        return ""
+
+    def _check_windows_efi_entries(self, drive_path: str, efi_output: str) -> bool:
+        """Check for Windows-related EFI boot entries.
+
+        Args:
+            drive_path: Drive path to check
+            efi_output: Output of "efibootmgr -v"
+
+        Returns:
+            True if Windows EFI entries found
+        """
+        device_name = drive_path.replace("/dev/", "")
+
+        # Look for Windows entries that reference this drive
+        return _efi_drive_pattern(device_name).search(efi_output) is not None
+
+    def get_drive_by_path(
+        self, path_or_drives: Union[str, List[Drive]], path: Optional[str] = None
+    ) -> Optional[Drive]:
+        """Get drive object by path from the last enumeration.
+
+        The legacy form get_drive_by_path(drives, path) is still accepted but
+        deprecated; it indexes the given list instead.
 
         Args:
-            drives: List of available drives
-            path: Drive path to find
+            path_or_drives: Drive path to find (or, deprecated, a drive list)
+            path: Drive path to find when a drive list is passed first
 
         Returns:
             Drive object if found, None otherwise
         """
-        for drive in drives:
-            if drive.path == path:
-                return drive
-        return None
+        if path is None:
+            return self._drive_index.get(path_or_drives)
+
+        warnings.warn(
+            "get_drive_by_path(drives, path) is deprecated; "
+            "use get_drive_by_path(path) after enumerate_drives()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return _index_drives(path_or_drives).get(path)
 
     def filter_safe_drives(self, drives: List[Drive], show_windows: bool = False) -> List[Drive]:
         """Filter drives for safe installation.
@@ -278,28 +655,56 @@ class HardwareManager:
         Returns:
             List of drives safe for installation
         """
-        safe_drives = []
-        
-        for drive in drives:
-            # Skip removable drives
-            if drive.is_removable:
-                continue
-                
-            # Skip too small drives (< 20GB)
-            if drive.size_gb < 20:
-                continue
-                
-            # Skip Windows drives unless explicitly requested
-            if drive.has_windows and not show_windows:
-                continue
-                
-            safe_drives.append(drive)
-            
-        return safe_drives
+        return list(self.filter_safe_drives_iter(drives, show_windows))
 
-    def detect_windows_comprehensive(self, drive_path: str) -> WindowsDetectionResult:
+    def filter_safe_drives_iter(
+        self, drives: List[Drive], show_windows: bool = False
+    ) -> Iterator[Drive]:
+        """Lazily yield drives that are safe for installation.
+
+        Skips removable drives, drives smaller than the minimum size, and
+        Windows drives unless explicitly requested.
+
+        Args:
+            drives: List of all drives
+            show_windows: Whether to include Windows drives
+
+        Returns:
+            Iterator over drives safe for installation
+        """
+        return (
+            drive for drive in drives
+            if not drive.is_removable
+            and drive.size_gb >= _MIN_DRIVE_SIZE_GB
+            and (show_windows or not drive.has_windows)
+        )
+
+    def detect_windows_comprehensive(
+        self, drive_path: str, refresh: bool = False
+    ) -> WindowsDetectionResult:
         """Comprehensive Windows detection with confidence levels.
 
+        Results are cached per drive path until clear_cache() is called.
+
+        Args:
+            drive_path: Drive path to analyze
+            refresh: Re-run detection even if a cached result exists
+
+        Returns:
+            Detailed Windows detection result
+        """
+        if not refresh:
+            cached = self._wdr_cache.get(drive_path)
+            if cached is not None:
+                return cached
+
+        result = self._analyze_windows(drive_path)
+        self._wdr_cache[drive_path] = result
+        return result
+
+    def _analyze_windows(self, drive_path: str) -> WindowsDetectionResult:
+        """Run all Windows detection methods against a drive.
+
         Args:
             drive_path: Drive path to analyze
 
@@ -313,24 +718,18 @@ class HardwareManager:
         if self.dry_run:
             # Mock comprehensive detection for testing
             if "nvme1n1" in drive_path:
-                return WindowsDetectionResult(
-                    has_windows=True,
-                    confidence_level="high",
-                    detection_methods=["NTFS filesystem", "Windows EFI entries"],
-                    windows_version="Windows 11",
-                    boot_entries=["Boot0001: Windows Boot Manager"]
-                )
-            else:
-                return WindowsDetectionResult(
-                    has_windows=False,
-                    confidence_level="high",
-                    detection_methods=["No Windows indicators found"]
-                )
+                return _MOCK_WDR_YES
+            return _MOCK_WDR_NO
 
         # Check filesystem signatures
         if self._has_ntfs_partitions(drive_path):
             detection_methods.append("NTFS filesystem")
             confidence = "medium"
+
+        # Check GPT partition labels ("Microsoft reserved partition", ...)
+        if self._has_microsoft_partitions(drive_path):
+            detection_methods.append("Microsoft partition labels")
+            confidence = "high"
             
         # Check for Windows directories
         if self._has_windows_directories(drive_path):
@@ -352,23 +751,24 @@ class HardwareManager:
         return WindowsDetectionResult(
             has_windows=has_windows,
             confidence_level=confidence,
-            detection_methods=detection_methods,
+            detection_methods=tuple(detection_methods),
             windows_version=windows_version,
-            boot_entries=efi_entries
+            boot_entries=tuple(efi_entries)
         )
 
     def _has_ntfs_partitions(self, drive_path: str) -> bool:
         """Check for NTFS partitions on drive."""
-        try:
-            result = subprocess.run(
-                ["blkid", "-o", "value", "-s", "TYPE", f"{drive_path}*"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return "ntfs" in result.stdout.lower()
-        except Exception:
-            return False
+        return any(
+            fields.get("TYPE") == "ntfs"
+            for fields in self._drive_partition_fields(drive_path)
+        )
+
+    def _has_microsoft_partitions(self, drive_path: str) -> bool:
+        """Check for Microsoft-labelled GPT partitions on drive."""
+        return any(
+            _is_microsoft_partition(fields)
+            for fields in self._drive_partition_fields(drive_path)
+        )
 
     def _has_windows_directories(self, drive_path: str) -> bool:
         """Check for Windows directory structure."""
@@ -378,24 +778,10 @@ class HardwareManager:
 
     def _get_windows_efi_entries(self, drive_path: str) -> List[str]:
         """Get Windows-related EFI entries for this drive."""
-        entries = []
-        try:
-            result = subprocess.run(
-                ["efibootmgr", "-v"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            if result.returncode == 0:
-                for line in result.stdout.splitlines():
-                    if any(keyword in line.lower() for keyword in ["windows", "microsoft"]):
-                        entries.append(line.strip())
-                        
-        except Exception:
-            pass
-            
-        return entries
+        return [
+            match.group().strip()
+            for match in _EFI_WIN_RE.finditer(self._read_efi_boot_entries())
+        ]
 
     def _detect_windows_version(self, drive_path: str) -> str:
         """Detect Windows version on drive."""
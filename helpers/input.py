@@ -4,34 +4,230 @@ This module provides custom input functions with character-level control,
 input validation, and cross-platform compatibility.
 """
 
+import contextlib
+import functools
+import os
 import sys
 import termios
-import tty
-from typing import Optional, Set
-
-
-def _build_choice_set(choices: list, case_sensitive: bool) -> set:
-    """Build a set of valid choices."""
+from typing import Callable, Iterator, List, Optional, Set, Tuple
+
+# Characters accepted when allow_symbols is set
+_SYMBOLS = frozenset('!@#$%^&*()_+-=[]{}|;:,.<>?/~`"\'\\')
+
+# Character category bits used by the allowed-character table
+_CAT_SPACE = 1
+_CAT_DIGIT = 2
+_CAT_LETTER = 4
+_CAT_SYMBOL = 8
+
+
+def _char_category(char: str) -> int:
+    """Classify a character for input filtering."""
+    if char == ' ':
+        return _CAT_SPACE
+    elif char.isdigit():
+        return _CAT_DIGIT
+    elif char.isalpha():
+        return _CAT_LETTER
+    elif char in _SYMBOLS:
+        return _CAT_SYMBOL
+    return 0
+
+
+# Category bits of every Latin-1 character, indexed by code point
+_CHAR_CATEGORIES = bytes(_char_category(chr(code)) for code in range(256))
+
+# Key classes for multi-character input, indexed by code point
+_KEY_PRINTABLE = 0
+_KEY_ENTER = 1
+_KEY_BACKSPACE = 2
+_KEY_EXIT = 3
+_KEY_ESCAPE = 4
+_KEY_IGNORE = 5
+
+_CHAR_DISPATCH = bytearray(256)
+_CHAR_DISPATCH[:32] = bytes([_KEY_IGNORE]) * 32
+_CHAR_DISPATCH[0x0d] = _CHAR_DISPATCH[0x0a] = _KEY_ENTER
+_CHAR_DISPATCH[0x08] = _CHAR_DISPATCH[0x7f] = _KEY_BACKSPACE
+_CHAR_DISPATCH[0x03] = _KEY_EXIT
+_CHAR_DISPATCH[0x1b] = _KEY_ESCAPE
+
+# Outcomes of a keystroke at a yes/no prompt, indexed by code point
+_CONFIRM_IGNORE = 0
+_CONFIRM_YES = 1
+_CONFIRM_NO = 2
+_CONFIRM_DEFAULT = 3
+_CONFIRM_EXIT = 4
+_CONFIRM_ESCAPE = 5
+
+_CONFIRM_TABLE = bytearray(256)
+_CONFIRM_TABLE[ord('y')] = _CONFIRM_TABLE[ord('Y')] = _CONFIRM_YES
+_CONFIRM_TABLE[ord('n')] = _CONFIRM_TABLE[ord('N')] = _CONFIRM_NO
+_CONFIRM_TABLE[0x0d] = _CONFIRM_TABLE[0x0a] = _CONFIRM_DEFAULT
+_CONFIRM_TABLE[0x03] = _CONFIRM_EXIT
+_CONFIRM_TABLE[0x1b] = _CONFIRM_ESCAPE
+
+# Control characters that single-character input skips (all but CR, LF
+# and ESC), indexed by code point
+_IGNORE_CTRL = bytes(1 if code < 32 and code not in (0x0a, 0x0d, 0x1b) else 0
+                     for code in range(256))
+
+# Erases the last echoed character
+_BACKSPACE_ECHO = b'\b \b'
+
+
+def _build_char_table(allow_space: bool, allow_numbers: bool, allow_letters: bool,
+                      allow_symbols: bool,
+                      forbidden_chars: Optional[Set[str]]) -> Tuple[bytearray, int]:
+    """Build the category lookup table for one input call.
+
+    Returns:
+        Tuple of (table, mask); a Latin-1 character is allowed when
+        table[ord(char)] & mask is non-zero
+    """
+    table = bytearray(_CHAR_CATEGORIES)
+    mask = ((_CAT_SPACE if allow_space else 0)
+            | (_CAT_DIGIT if allow_numbers else 0)
+            | (_CAT_LETTER if allow_letters else 0)
+            | (_CAT_SYMBOL if allow_symbols else 0))
+
+    if forbidden_chars:
+        for char in forbidden_chars:
+            if len(char) == 1 and ord(char) < 256:
+                table[ord(char)] = 0
+
+    return table, mask
+
+
+def _build_char_predicate(allow_space: bool, allow_numbers: bool, allow_letters: bool,
+                          allow_symbols: bool, allowed_chars: Optional[Set[str]],
+                          forbidden_chars: Optional[Set[str]]) -> Callable[[str], bool]:
+    """Decide once per input call how typed characters are checked.
+
+    Returns:
+        Predicate returning True for characters that may be typed
+    """
+    if allowed_chars:
+        # Explicit allow-list: the category flags do not apply
+        return frozenset(allowed_chars).difference(forbidden_chars or ()).__contains__
+
+    table, mask = _build_char_table(allow_space, allow_numbers, allow_letters,
+                                    allow_symbols, forbidden_chars)
+    # Latin-1 forbidden characters are already zeroed in the table; only the
+    # rest need a set, frozen so later changes by the caller do not leak in
+    forbidden = frozenset(char for char in forbidden_chars or ()
+                          if len(char) != 1 or ord(char) >= 256)
+
+    def is_allowed(char: str) -> bool:
+        code = ord(char)
+        if code < 256:
+            return table[code] & mask != 0
+        # Outside Latin-1: apply the same rules without the table
+        return char not in forbidden and _char_category(char) & mask != 0
+
+    return is_allowed
+
+
+@functools.lru_cache(maxsize=64)
+def _build_choice_set(choices: tuple, case_sensitive: bool) -> frozenset:
+    """Build a set of valid choices, cached per distinct menu."""
     if case_sensitive:
-        return {str(item) for item in choices}
+        return frozenset(str(item) for item in choices)
     else:
-        return {str(item).lower() for item in choices}
-
-
-def _handle_enter(current_result: str) -> dict:
-    """Handle Enter key press."""
-    if current_result:  # Only accept Enter if something was typed
-        return {"type": "submit"}
-    return {"type": "ignore"}
-
-
-def _handle_backspace(current_result: str) -> dict:
-    """Handle Backspace key press."""
-    if current_result:
-        new_result = current_result[:-1]
-        print('\b \b', end='', flush=True)
-        return {"type": "backspace", "result": new_result}
-    return {"type": "ignore"}
+        return frozenset(str(item).lower() for item in choices)
+
+
+def _stdout_encoding() -> str:
+    """Get the encoding used for echo output."""
+    return getattr(sys.stdout, "encoding", None) or "utf-8"
+
+
+def _write(data: bytes) -> None:
+    """Write pre-encoded echo output immediately, bypassing print().
+
+    Writes straight to the stdout byte buffer and flushes it, falling back
+    to the text stream when stdout has no buffer (e.g. a StringIO).
+    """
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:
+        stream.write(data.decode(_stdout_encoding(), "replace"))
+        stream.flush()
+        return
+    buffer.write(data)
+    buffer.flush()
+
+
+def _echo(text: str) -> None:
+    """Echo typed text immediately."""
+    _write(text.encode(_stdout_encoding(), "replace"))
+
+
+def _utf8_sequence_length(lead: int) -> int:
+    """Return the encoded length of a UTF-8 character from its lead byte.
+
+    Args:
+        lead: First byte of the character (0x80 or above)
+
+    Returns:
+        Total byte count; invalid lead bytes count as a single byte
+    """
+    if 0xC2 <= lead < 0xE0:
+        return 2
+    if 0xE0 <= lead < 0xF0:
+        return 3
+    if 0xF0 <= lead < 0xF5:
+        return 4
+    return 1
+
+
+def _escape_sequence_length(data: bytes) -> Optional[int]:
+    """Measure the escape sequence at the start of data (after the ESC).
+
+    Args:
+        data: Bytes that followed an ESC
+
+    Returns:
+        Number of bytes belonging to the sequence, or None if more bytes are
+        needed (including after a bare ESC)
+    """
+    if not data:
+        return None
+    if data[:1] == b'[':
+        # CSI: parameter and intermediate bytes, then a final byte in 0x40-0x7E
+        for end in range(1, len(data)):
+            if 0x40 <= data[end] <= 0x7e:
+                return end + 1
+        return None
+    if data[:1] == b'O':
+        return 2 if len(data) >= 2 else None  # SS3: one final byte
+    return 1  # ESC + key (e.g. Alt+key) drops the key
+
+
+def _make_raw_termios(settings: list) -> list:
+    """Derive raw-mode terminal attributes from the original settings.
+
+    Follows cfmakeraw(3), except that output post-processing stays enabled
+    so newlines printed during a raw session still return the carriage.
+    VMIN=1/VTIME=0 makes each read return as soon as one byte arrives.
+
+    Args:
+        settings: Attributes as returned by termios.tcgetattr
+
+    Returns:
+        New attribute list for termios.tcsetattr
+    """
+    raw = list(settings)
+    raw[6] = list(settings[6])
+    raw[0] &= ~(termios.IGNBRK | termios.BRKINT | termios.PARMRK | termios.ISTRIP
+                | termios.INLCR | termios.IGNCR | termios.ICRNL | termios.IXON)
+    raw[2] &= ~(termios.CSIZE | termios.PARENB)
+    raw[2] |= termios.CS8
+    raw[3] &= ~(termios.ECHO | termios.ECHONL | termios.ICANON | termios.ISIG
+                | termios.IEXTEN)
+    raw[6][termios.VMIN] = 1
+    raw[6][termios.VTIME] = 0
+    return raw
 
 
 class InputHandler:
@@ -40,11 +236,20 @@ class InputHandler:
     def __init__(self) -> None:
         """Initialize input handler."""
         self.is_windows = sys.platform.startswith('win')
+        self._fd: Optional[int] = None
+        self._orig_termios: Optional[List] = None
+        self._raw_termios: Optional[List] = None
+        self._escape_termios: Optional[List] = None
+        self._raw_depth = 0
+        self._pending = b''
         self.has_terminal = self._check_terminal_support()
+        if not self.has_terminal:
+            # No raw input available: plain line input, decided once here
+            self.custom_input = self._fallback_input  # type: ignore[method-assign]
 
     def _check_terminal_support(self) -> bool:
         """Check if we have proper terminal support for raw input.
-        
+
         Returns:
             True if terminal supports raw character input
         """
@@ -53,16 +258,48 @@ class InputHandler:
                 import msvcrt
                 return True
             else:
-                # Check if we can access terminal settings
+                # Check if we can access terminal settings, and keep them
                 fd = sys.stdin.fileno()
-                termios.tcgetattr(fd)
+                self._orig_termios = termios.tcgetattr(fd)
+                self._raw_termios = _make_raw_termios(self._orig_termios)
+                # Escape-sequence tails: return whatever arrives within 100ms
+                self._escape_termios = list(self._raw_termios)
+                self._escape_termios[6] = list(self._raw_termios[6])
+                self._escape_termios[6][termios.VMIN] = 0
+                self._escape_termios[6][termios.VTIME] = 1
+                self._fd = fd
                 return sys.stdin.isatty()
         except (ImportError, termios.error, OSError):
             return False
 
+    @contextlib.contextmanager
+    def raw_session(self) -> Iterator[None]:
+        """Keep the terminal in raw mode for a whole input loop.
+
+        The terminal is switched once on entry and restored once on exit
+        instead of around every character. Nested sessions reuse the
+        outermost one; without a POSIX terminal this is a no-op.
+        """
+        if self._raw_depth or self._fd is None or not self.has_terminal:
+            self._raw_depth += 1
+            try:
+                yield
+            finally:
+                self._raw_depth -= 1
+            return
+
+        # TCSANOW: no need to wait for pending output before switching
+        termios.tcsetattr(self._fd, termios.TCSANOW, self._raw_termios)
+        self._raw_depth = 1
+        try:
+            yield
+        finally:
+            self._raw_depth = 0
+            termios.tcsetattr(self._fd, termios.TCSADRAIN, self._orig_termios)
+
     def getch(self) -> str:
         """Get a single character from stdin without pressing Enter.
-        
+
         Returns:
             Single character pressed
         """
@@ -73,16 +310,63 @@ class InputHandler:
             
         if self.is_windows:
             import msvcrt
-            return msvcrt.getch().decode('utf-8')
+            data = msvcrt.getch()
+            if data[0] < 0x80:
+                return chr(data[0])
+            return self._read_utf8_tail(data[0], msvcrt.getch)
+        elif self._raw_depth:
+            return self._read_char()
         else:
-            fd = sys.stdin.fileno()
-            old_settings = termios.tcgetattr(fd)
-            try:
-                tty.setraw(sys.stdin.fileno())
-                ch = sys.stdin.read(1)
-            finally:
-                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-            return ch
+            with self.raw_session():
+                return self._read_char()
+
+    def _read_char(self) -> str:
+        """Read one character straight from the terminal descriptor.
+
+        Bytes are read with os.read, skipping the sys.stdin buffering layers.
+        Input is taken as UTF-8: ASCII bytes map directly to characters and
+        only a high lead byte makes the continuation bytes get read.
+
+        Returns:
+            Character read, or an empty string at end of input
+        """
+        pending = self._pending
+        if pending:
+            data, self._pending = pending[:1], pending[1:]
+        else:
+            data = os.read(self._fd, 1)
+        if not data:
+            return ''
+        lead = data[0]
+        if lead < 0x80:
+            return chr(lead)
+        return self._read_utf8_tail(lead, self._read_byte)
+
+    def _read_byte(self) -> bytes:
+        """Read one byte, taking bytes left over from an escape sequence first.
+
+        Returns:
+            Single byte, or empty bytes at end of input
+        """
+        if self._pending:
+            data, self._pending = self._pending[:1], self._pending[1:]
+            return data
+        return os.read(self._fd, 1)
+
+    def _read_utf8_tail(self, lead: int, read_byte: Callable[[], bytes]) -> str:
+        """Complete a multi-byte UTF-8 character from its lead byte.
+
+        Args:
+            lead: First byte of the character, already read
+            read_byte: Callable returning the next input byte
+
+        Returns:
+            Decoded character; malformed input yields U+FFFD
+        """
+        data = bytes((lead,))
+        for _ in range(_utf8_sequence_length(lead) - 1):
+            data += read_byte()
+        return data.decode('utf-8', 'replace')[:1]
 
     def custom_input(
         self,
@@ -119,128 +403,151 @@ class InputHandler:
         if prompt:
             print(prompt, end='', flush=True)
 
+        # Encode the echo character once rather than per keystroke
+        echo_bytes = (echo_char.encode(_stdout_encoding(), "replace")
+                      if echo_char is not None else None)
+
         if single_char:
-            return self._single_char_input(echo_char, case_sensitive)
+            return self._single_char_input(echo_bytes, case_sensitive)
         else:
-            return self._multi_char_input(echo_char, case_sensitive, allow_space, 
-                                        allow_numbers, allow_letters, allow_symbols, 
-                                        allowed_chars, forbidden_chars, max_length)
+            is_allowed = _build_char_predicate(allow_space, allow_numbers, allow_letters,
+                                               allow_symbols, allowed_chars, forbidden_chars)
+            return self._multi_char_input(echo_bytes, case_sensitive, is_allowed, max_length)
 
-    def _single_char_input(self, echo_char: Optional[str], case_sensitive: bool) -> str:  # type: ignore
+    def _fallback_input(
+        self,
+        prompt: str = "",
+        single_char: bool = False,
+        allow_space: bool = True,
+        allow_numbers: bool = True,
+        allow_letters: bool = True,
+        allow_symbols: bool = False,
+        allowed_chars: Optional[Set[str]] = None,
+        forbidden_chars: Optional[Set[str]] = None,
+        echo_char: Optional[str] = None,
+        max_length: Optional[int] = None,
+        case_sensitive: bool = True
+    ) -> str:
+        """Line-based custom_input used when no terminal is available.
+
+        Takes the same arguments as custom_input; character filters and
+        echo do not apply to line input.
+        """
+        if single_char:
+            response = input(f"{prompt}(Enter character + Enter): ")
+            result = response[0] if response else ' '
+        else:
+            result = input(prompt)
+            if max_length:
+                result = result[:max_length]
+        return result.lower() if not case_sensitive else result
+
+    def _single_char_input(self, echo_bytes: Optional[bytes], case_sensitive: bool) -> str:  # type: ignore
         """Handle single character input."""
-        while True:
-            char = self.getch()
-            
-            # Handle escape sequences
-            if char == '\x1b':  # ESC character
-                self._consume_escape_sequence()
-                continue
-            
-            # Filter out control characters except CR/LF
-            if ord(char) < 32 and char not in ('\r', '\n'):
-                continue
-            
-            # Display the character appropriately
-            if echo_char is not None:
-                print(echo_char, end='', flush=True)
-            elif char in ('\r', '\n'):
-                print('<Enter>')
-                return str(char)
-            else:
-                print(char, end='', flush=True)
-            
-            print()  # Newline after single char
-            result = char.lower() if not case_sensitive else char
-            return str(result)
-
-    def _multi_char_input(self, echo_char: Optional[str], case_sensitive: bool,
-                         allow_space: bool, allow_numbers: bool, allow_letters: bool,
-                         allow_symbols: bool, allowed_chars: Optional[Set[str]],
-                         forbidden_chars: Optional[Set[str]], max_length: Optional[int]) -> str:
-        """Handle multi-character input."""
-        # Fallback for non-terminal environments
-        if not self.has_terminal:
-            result = input()
-            return result.lower() if not case_sensitive else result
+        getch = self.getch
+        ignore_ctrl = _IGNORE_CTRL
 
-        result = ""
-        
-        while True:
-            char = self.getch()
-            
-            action = self._process_char(char, result, echo_char, case_sensitive,
-                                      allow_space, allow_numbers, allow_letters,
-                                      allow_symbols, allowed_chars, forbidden_chars,
-                                      max_length)
+        with self.raw_session():
+            while True:
+                char = getch()
             
-            if action["type"] == "submit":
-                print()
-                break
-            elif action["type"] == "backspace":
-                result = action["result"]
-            elif action["type"] == "add_char":
-                result = action["result"]
-            elif action["type"] == "exit":
-                print()
-                raise KeyboardInterrupt
-
-        return result
-
-    def _process_char(self, char: str, current_result: str, echo_char: Optional[str],
-                     case_sensitive: bool, allow_space: bool, allow_numbers: bool,
-                     allow_letters: bool, allow_symbols: bool, 
-                     allowed_chars: Optional[Set[str]], forbidden_chars: Optional[Set[str]],
-                     max_length: Optional[int]) -> dict:
-        """Process a single character and return action to take."""
-        
-        # Handle special characters first
-        if char in ('\r', '\n'):
-            return _handle_enter(current_result)
-        elif char in ('\b', '\x7f'):
-            return _handle_backspace(current_result)
-        elif char == '\x03':
-            return {"type": "exit"}
-        elif char == '\x1b':
-            self._consume_escape_sequence()
-            return {"type": "ignore"}
-        elif ord(char) < 32:
-            return {"type": "ignore"}
-        else:
-            return self._handle_printable_char(char, current_result, echo_char, case_sensitive,
-                                             allow_space, allow_numbers, allow_letters,
-                                             allow_symbols, allowed_chars, forbidden_chars,
-                                             max_length)
-
-    def _handle_printable_char(self, char: str, current_result: str, echo_char: Optional[str],
-                              case_sensitive: bool, allow_space: bool, allow_numbers: bool,
-                              allow_letters: bool, allow_symbols: bool,
-                              allowed_chars: Optional[Set[str]], forbidden_chars: Optional[Set[str]],
-                              max_length: Optional[int]) -> dict:
-        """Handle printable character input."""
-        # Check if character is allowed
-        if not self._is_char_allowed(char, allow_space, allow_numbers, 
-                                   allow_letters, allow_symbols, 
-                                   allowed_chars, forbidden_chars):
-            return {"type": "ignore"}
+                # Handle escape sequences
+                if char == '\x1b':  # ESC character
+                    self._consume_escape_sequence()
+                    continue
             
-        # Check max length
-        if max_length and len(current_result) >= max_length:
-            return {"type": "ignore"}
+                # Filter out control characters except CR/LF
+                code = ord(char)
+                if code < 256 and ignore_ctrl[code]:
+                    continue
             
-        # Add character to result
-        display_char = char if case_sensitive else char.lower()
-        new_result = current_result + display_char
-        
-        # Echo character
-        if echo_char is not None:
-            print(echo_char, end='', flush=True)
-        else:
-            print(display_char, end='', flush=True)
+                # Display the character and the newline in one write
+                if echo_bytes is not None:
+                    _write(echo_bytes + b'\n')
+                elif char in ('\r', '\n'):
+                    _write(b'<Enter>\n')
+                    return str(char)
+                else:
+                    _echo(char + '\n')
             
-        return {"type": "add_char", "result": new_result}
+                result = char.lower() if not case_sensitive else char
+                return str(result)
+
+    def _multi_char_input(self, echo_bytes: Optional[bytes], case_sensitive: bool,
+                         is_allowed: Callable[[str], bool],
+                         max_length: Optional[int]) -> str:
+        """Handle multi-character input.
+
+        Key classification, filtering, echo and buffer updates run inline in
+        a single loop with locally bound helpers, as this runs per keystroke.
+        """
+        # Typed characters are collected in a list and joined once at submit
+        buffer: List[str] = []
+        append = buffer.append
+        getch = self.getch
+        dispatch = _CHAR_DISPATCH
+        write = _write
+        echo = _echo
+
+        with self.raw_session():
+            while True:
+                char = getch()
+                code = ord(char)
+                key = dispatch[code] if code < 256 else _KEY_PRINTABLE
+
+                # Printable characters are the common case, so test them first
+                if key == _KEY_PRINTABLE:
+                    if not is_allowed(char):
+                        continue
+                    if max_length and len(buffer) >= max_length:
+                        continue
+                    # Case is folded once at submit; the echo shows it already
+                    append(char)
+                    if echo_bytes is not None:
+                        write(echo_bytes)
+                    else:
+                        echo(char if case_sensitive else char.lower())
+                elif key == _KEY_ENTER:
+                    if buffer:  # Only accept Enter if something was typed
+                        break
+                elif key == _KEY_BACKSPACE:
+                    if buffer:
+                        buffer.pop()
+                        write(_BACKSPACE_ECHO)
+                elif key == _KEY_EXIT:
+                    write(b'\n')
+                    raise KeyboardInterrupt
+                elif key == _KEY_ESCAPE:
+                    self._consume_escape_sequence()
+
+        write(b'\n')
+        result = ''.join(buffer)
+        return result if case_sensitive else result.lower()
 
     def _consume_escape_sequence(self) -> None:
-        """Consume escape sequence (arrow keys, etc.)."""
+        """Consume escape sequence (arrow keys, etc.).
+
+        On a POSIX terminal the rest of the sequence is fetched with one
+        short-timeout read, so a bare ESC press does not block. Bytes read
+        past the end of the sequence are kept for the next getch().
+        """
+        if self._fd is not None and self.has_terminal and not self.is_windows:
+            data = self._pending
+            with self.raw_session():
+                termios.tcsetattr(self._fd, termios.TCSANOW, self._escape_termios)
+                try:
+                    # Usually one read; more only if the sequence arrives split
+                    while _escape_sequence_length(data) is None:
+                        chunk = os.read(self._fd, 16)
+                        if not chunk:
+                            break
+                        data += chunk
+                finally:
+                    termios.tcsetattr(self._fd, termios.TCSANOW, self._raw_termios)
+
+            self._pending = data[_escape_sequence_length(data) or len(data):]
+            return
+
         try:
             next_char = self.getch()
             if next_char == '[':
@@ -248,50 +555,6 @@ class InputHandler:
         except:
             pass
 
-    def _is_char_allowed(
-        self,
-        char: str,
-        allow_space: bool,
-        allow_numbers: bool,
-        allow_letters: bool,
-        allow_symbols: bool,
-        allowed_chars: Optional[Set[str]],
-        forbidden_chars: Optional[Set[str]]
-    ) -> bool:
-        """Check if character is allowed based on rules.
-
-        Args:
-            char: Character to check
-            allow_space: Allow space character
-            allow_numbers: Allow numeric characters
-            allow_letters: Allow alphabetic characters
-            allow_symbols: Allow symbol characters
-            allowed_chars: Specific allowed characters
-            forbidden_chars: Specific forbidden characters
-
-        Returns:
-            True if character is allowed
-        """
-        # Check forbidden characters first
-        if forbidden_chars and char in forbidden_chars:
-            return False
-
-        # If allowed_chars is specified, only allow those
-        if allowed_chars:
-            return char in allowed_chars
-
-        # Check specific character types
-        if char == ' ':
-            return allow_space
-        elif char.isdigit():
-            return allow_numbers
-        elif char.isalpha():
-            return allow_letters
-        elif char in '!@#$%^&*()_+-=[]{}|;:,.<>?/~`"\'\\':
-            return allow_symbols
-        else:
-            return False
-
     def confirm_input(self, prompt: str = "Continue? (y/n): ", 
                      default: Optional[bool] = None) -> bool:
         """Get yes/no confirmation with single character input.
@@ -305,13 +568,14 @@ class InputHandler:
         """
         formatted_prompt = self._format_confirm_prompt(prompt, default)
         print(formatted_prompt, end='', flush=True)
-        
-        while True:
-            char = self.getch()
-            result = self._process_confirm_char(char, default)
+
+        with self.raw_session():
+            while True:
+                char = self.getch()
+                result = self._process_confirm_char(char, default)
             
-            if result is not None:
-                return result
+                if result is not None:
+                    return result
 
     def _format_confirm_prompt(self, prompt: str, default: Optional[bool]) -> str:
         """Format confirmation prompt with default indicator."""
@@ -323,30 +587,30 @@ class InputHandler:
 
     def _process_confirm_char(self, char: str, default: Optional[bool]) -> Optional[bool]:
         """Process confirmation character input."""
-        # Handle Enter - use default
-        if char in ('\r', '\n') and default is not None:
-            default_char = 'Y' if default else 'n'
-            print(default_char)
-            return default
+        code = ord(char)
+        outcome = _CONFIRM_TABLE[code] if code < 256 else _CONFIRM_IGNORE
+
         # Handle y/Y
-        elif char.lower() == 'y':
-            print(char.upper())
+        if outcome == _CONFIRM_YES:
+            _write(b'Y\n')
             return True
-        # Handle n/N  
-        elif char.lower() == 'n':
-            print(char.upper())
+        # Handle n/N
+        elif outcome == _CONFIRM_NO:
+            _write(b'N\n')
             return False
+        # Handle Enter - use default
+        elif outcome == _CONFIRM_DEFAULT and default is not None:
+            _write(b'Y\n' if default else b'n\n')
+            return default
         # Handle Ctrl+C
-        elif char == '\x03':
-            print()
+        elif outcome == _CONFIRM_EXIT:
+            _write(b'\n')
             raise KeyboardInterrupt
         # Handle escape sequences (ignore)
-        elif char == '\x1b':
+        elif outcome == _CONFIRM_ESCAPE:
             self._consume_escape_sequence()
-            return None
         # All other characters are ignored
-        else:
-            return None
+        return None
 
     def password_input(self, prompt: str = "Password: ", 
                       confirm: bool = False) -> str:
@@ -397,20 +661,26 @@ class InputHandler:
         Returns:
             Validated integer
         """
+        # A minus sign can only be typed when the range admits negatives
+        allow_negative = min_value is not None and min_value < 0
+
         while True:
             try:
-                text = self.custom_input(
-                    prompt,
-                    allow_letters=False,
-                    allow_symbols=False,
-                    allow_space=False,
-                    max_length=max_length
-                )
-                
-                if not text:
-                    continue
-                    
-                value = int(text)
+                if self.has_terminal:
+                    value = self._read_integer(prompt, max_length, allow_negative)
+                else:
+                    text = self.custom_input(
+                        prompt,
+                        allow_letters=False,
+                        allow_symbols=False,
+                        allow_space=False,
+                        max_length=max_length
+                    )
+
+                    if not text:
+                        continue
+
+                    value = int(text)
                 
                 if min_value is not None and value < min_value:
                     print(f"Value must be at least {min_value}")
@@ -425,6 +695,66 @@ class InputHandler:
             except ValueError:
                 print("Please enter a valid number")
 
+    def _read_integer(self, prompt: str, max_length: Optional[int],
+                      allow_negative: bool) -> int:
+        """Read ASCII digits from the terminal straight into an integer.
+
+        Args:
+            prompt: Input prompt
+            max_length: Maximum input length, including a minus sign
+            allow_negative: Accept a leading minus sign
+
+        Returns:
+            Entered integer
+
+        Raises:
+            ValueError: If only a minus sign was entered
+            KeyboardInterrupt: If Ctrl+C is pressed
+        """
+        print(prompt, end='', flush=True)
+        value = 0
+        digits = 0
+        negative = False
+        getch = self.getch
+        write = _write
+        echo = _echo
+
+        with self.raw_session():
+            while True:
+                char = getch()
+                code = ord(char)
+
+                if 0x30 <= code <= 0x39:
+                    if max_length and digits + negative >= max_length:
+                        continue
+                    value = value * 10 + (code - 0x30)
+                    digits += 1
+                    echo(char)
+                elif code == 0x2d and allow_negative and not negative and not digits:
+                    negative = True
+                    write(b'-')
+                elif code in (0x0d, 0x0a):
+                    if digits or negative:  # Only accept Enter if something was typed
+                        break
+                elif code in (0x08, 0x7f):
+                    if digits:
+                        value //= 10
+                        digits -= 1
+                        write(_BACKSPACE_ECHO)
+                    elif negative:
+                        negative = False
+                        write(_BACKSPACE_ECHO)
+                elif code == 0x03:
+                    write(b'\n')
+                    raise KeyboardInterrupt
+                elif code == 0x1b:
+                    self._consume_escape_sequence()
+
+        write(b'\n')
+        if not digits:
+            raise ValueError("no digits entered")
+        return -value if negative else value
+
     def choice_input(self, prompt: str, choices: list,
                     single_char: bool = True,
                     case_sensitive: bool = True) -> str:
@@ -439,35 +769,36 @@ class InputHandler:
         Returns:
             Selected choice
         """
-        valid_choices = _build_choice_set(choices, case_sensitive)
-        
+        valid_choices = _build_choice_set(tuple(choices), case_sensitive)
+
         if single_char:
             return self._single_char_choice(prompt, valid_choices, case_sensitive)
         else:
             return self._multi_char_choice(prompt, choices, valid_choices, case_sensitive)
 
-    def _single_char_choice(self, prompt: str, valid_choices: set, case_sensitive: bool) -> str:
+    def _single_char_choice(self, prompt: str, valid_choices: frozenset, case_sensitive: bool) -> str:
         """Handle single character choice input."""
         print(prompt, end='', flush=True)
-        while True:
-            char = self.getch()
+        with self.raw_session():
+            while True:
+                char = self.getch()
             
-            # Handle Ctrl+C
-            if char == '\x03':
-                print()
-                raise KeyboardInterrupt
-            # Handle escape sequences (ignore)
-            elif char == '\x1b':
-                self._consume_escape_sequence()
-            # Check if valid choice
-            else:
-                test_char = char if case_sensitive else char.lower()
-                if test_char in valid_choices:
-                    print(char)
-                    return char
-            # Invalid choice - silently ignore
-
-    def _multi_char_choice(self, prompt: str, choices: list, valid_choices: set, case_sensitive: bool) -> str:
+                # Handle Ctrl+C
+                if char == '\x03':
+                    _write(b'\n')
+                    raise KeyboardInterrupt
+                # Handle escape sequences (ignore)
+                elif char == '\x1b':
+                    self._consume_escape_sequence()
+                # Check if valid choice
+                else:
+                    test_char = char if case_sensitive else char.lower()
+                    if test_char in valid_choices:
+                        _echo(char + '\n')
+                        return char
+                # Invalid choice - silently ignore
+
+    def _multi_char_choice(self, prompt: str, choices: list, valid_choices: frozenset, case_sensitive: bool) -> str:
         """Handle multi-character choice input."""
         while True:
             response = self.custom_input(
@@ -476,8 +807,8 @@ class InputHandler:
                 case_sensitive=case_sensitive
             )
             
-            test_response = response if case_sensitive else response.lower()
-            if test_response in valid_choices:
+            # custom_input already lowercased the response if case-insensitive
+            if response in valid_choices:
                 return response
             else:
                 print(f"Please choose from: {', '.join(map(str, choices))}")
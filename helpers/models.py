@@ -6,21 +6,273 @@ including configuration models and hardware representation classes.
 
 from __future__ import annotations
 
-import json
+import contextlib
+import functools
+import operator
 import os
-from dataclasses import dataclass, field
-from typing import Any, Dict, List
+import socket
+import sys
+from dataclasses import MISSING, dataclass, field, fields
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
-from .exceptions import ValidationError
+from .exceptions import ValidationIssue
 from .validation import (
     validate_hostname,
-    validate_ip_address,
+    validate_ip_addresses,
     validate_locale,
+    validate_swap_size,
     validate_username,
 )
 
+# Read and write configuration files with orjson when it is installed and
+# this flag is set; the standard library json module stays the default.
+# Both are imported on first save/load, keeping validation-only imports light
+USE_ORJSON = False
 
-@dataclass
+# Accepted NetworkConfig.network_type values
+_VALID_NET_TYPES: FrozenSet[str] = frozenset(("dhcp", "static", "manual"))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_orjson() -> Any:
+    """Import orjson on first use.
+
+    Returns:
+        The orjson module, or None if it is not installed
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve JSON_DECODE_ERRORS on first access (PEP 562).
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        Tuple of exceptions raised for malformed JSON by the supported parsers
+
+    Raises:
+        AttributeError: If name is not a lazily resolved attribute
+    """
+    if name != "JSON_DECODE_ERRORS":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import json
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    value: Tuple[type, ...] = (json.JSONDecodeError,)
+    globals()[name] = value
+    return value
+
+
+def _intern(value: Any) -> Any:
+    """Intern a string field value, leaving other types untouched.
+
+    Args:
+        value: Field value, normally a string
+
+    Returns:
+        The interned string, or the value unchanged if it is not a str
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+@functools.lru_cache(maxsize=128)
+def _validate_network(
+    network_type: str, ip_address: str, gateway: str
+) -> Tuple[ValidationIssue, ...]:
+    """Validate the network fields that NetworkConfig.validate checks.
+
+    Results are memoized on the field values, so re-validating an unchanged
+    configuration skips the validators.
+
+    Args:
+        network_type: "dhcp", "static", or "manual"
+        ip_address: Static IP address
+        gateway: Gateway IP
+
+    Returns:
+        Tuple of validation issues (empty if valid)
+    """
+    errors: List[ValidationIssue] = []
+    append = errors.append
+
+    if network_type not in _VALID_NET_TYPES:
+        append(
+            ValidationIssue(
+                "Invalid network type",
+                "network_type",
+                network_type,
+                "dhcp, static, or manual",
+            )
+        )
+
+    if network_type == "static":
+        ip_ok, gateway_ok = validate_ip_addresses(ip_address, gateway)
+
+        if not ip_address:
+            append(
+                ValidationIssue(
+                    "IP address required for static configuration",
+                    "ip_address",
+                    ip_address,
+                    "Valid IP address",
+                )
+            )
+        elif not ip_ok:
+            append(
+                ValidationIssue(
+                    "Invalid IP address format",
+                    "ip_address",
+                    ip_address,
+                    "Valid IP address (e.g., 192.168.1.100)",
+                )
+            )
+
+        if not gateway:
+            append(
+                ValidationIssue(
+                    "Gateway required for static configuration",
+                    "gateway",
+                    gateway,
+                    "Valid gateway IP address",
+                )
+            )
+        elif not gateway_ok:
+            append(
+                ValidationIssue(
+                    "Invalid gateway IP address",
+                    "gateway",
+                    gateway,
+                    "Valid IP address",
+                )
+            )
+
+    return tuple(errors)
+
+
+@functools.lru_cache(maxsize=128)
+def _validate_system(
+    target_drive: str,
+    user_fullname: str,
+    username: str,
+    hostname: str,
+    locale: str,
+    swap_size: str,
+) -> Tuple[ValidationIssue, ...]:
+    """Validate the fields that SystemConfig.validate checks itself.
+
+    Results are memoized on the field values, so re-validating an unchanged
+    configuration skips the validators.
+
+    Args:
+        target_drive: Selected drive path
+        user_fullname: User's full name
+        username: Primary user account name
+        hostname: System hostname
+        locale: System locale
+        swap_size: Swap file size or "auto"
+
+    Returns:
+        Tuple of validation issues (empty if valid)
+    """
+    errors: List[ValidationIssue] = []
+    append = errors.append
+
+    # Validate required fields
+    if not target_drive:
+        append(
+            ValidationIssue(
+                "Target drive is required",
+                "target_drive",
+                target_drive,
+                "Valid drive path (e.g., /dev/nvme0n1)",
+            )
+        )
+    elif not target_drive.startswith("/dev/"):
+        append(
+            ValidationIssue(
+                "Invalid drive path format",
+                "target_drive",
+                target_drive,
+                "Path starting with /dev/",
+            )
+        )
+
+    if not user_fullname:
+        append(
+            ValidationIssue(
+                "User full name is required",
+                "user_fullname",
+                user_fullname,
+                "User's full name",
+            )
+        )
+
+    if not username:
+        append(
+            ValidationIssue(
+                "Username is required",
+                "username",
+                username,
+                "Valid Linux username",
+            )
+        )
+    elif not validate_username(username):
+        append(
+            ValidationIssue(
+                "Invalid username format",
+                "username",
+                username,
+                "Lowercase letters, numbers, underscore, starting with letter",
+            )
+        )
+
+    if not hostname:
+        append(
+            ValidationIssue(
+                "Hostname is required", "hostname", hostname, "Valid hostname"
+            )
+        )
+    elif not validate_hostname(hostname):
+        append(
+            ValidationIssue(
+                "Invalid hostname format",
+                "hostname",
+                hostname,
+                "Letters, numbers, hyphens, no spaces",
+            )
+        )
+
+    if not validate_locale(locale):
+        append(
+            ValidationIssue(
+                "Invalid locale format",
+                "locale",
+                locale,
+                "Format: xx_XX.UTF-8",
+            )
+        )
+
+    if not validate_swap_size(swap_size):
+        append(
+            ValidationIssue(
+                "Invalid swap size",
+                "swap_size",
+                swap_size,
+                'Size with optional K/M/G unit (e.g., 4G) or "auto"',
+            )
+        )
+
+    return tuple(errors)
+
+
+@dataclass(slots=True)
 class NetworkConfig:
     """Network configuration settings.
 
@@ -43,65 +295,26 @@ class NetworkConfig:
     dns_servers: str = ""
     domain_search: str = ""
     dns_suffix: str = ""
+    # (checked field values, issues) from the last validate() call
+    _validated: Optional[Tuple[tuple, Tuple[ValidationIssue, ...]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    def validate(self) -> List[ValidationError]:
+    def __post_init__(self) -> None:
+        """Intern the enumerated network type so comparisons hit identity."""
+        self.network_type = _intern(self.network_type)
+
+    def validate(self) -> List[ValidationIssue]:
         """Validate network configuration.
 
         Returns:
-            List of validation errors (empty if valid)
+            List of validation issues (empty if valid)
         """
-        errors = []
-
-        if self.network_type not in ("dhcp", "static", "manual"):
-            errors.append(
-                ValidationError(
-                    "Invalid network type",
-                    "network_type",
-                    self.network_type,
-                    "dhcp, static, or manual",
-                )
-            )
-
-        if self.network_type == "static":
-            if not self.ip_address:
-                errors.append(
-                    ValidationError(
-                        "IP address required for static configuration",
-                        "ip_address",
-                        self.ip_address,
-                        "Valid IP address",
-                    )
-                )
-            elif not validate_ip_address(self.ip_address):
-                errors.append(
-                    ValidationError(
-                        "Invalid IP address format",
-                        "ip_address",
-                        self.ip_address,
-                        "Valid IP address (e.g., 192.168.1.100)",
-                    )
-                )
-
-            if not self.gateway:
-                errors.append(
-                    ValidationError(
-                        "Gateway required for static configuration",
-                        "gateway",
-                        self.gateway,
-                        "Valid gateway IP address",
-                    )
-                )
-            elif not validate_ip_address(self.gateway):
-                errors.append(
-                    ValidationError(
-                        "Invalid gateway IP address",
-                        "gateway",
-                        self.gateway,
-                        "Valid IP address",
-                    )
-                )
-
-        return errors
+        key = (self.network_type, self.ip_address, self.gateway)
+        memo = self._validated
+        if memo is None or memo[0] != key:
+            memo = self._validated = (key, _validate_network(*key))
+        return list(memo[1])
 
     def to_systemd_config(self) -> str:
         """Generate systemd-networkd configuration.
@@ -109,47 +322,43 @@ class NetworkConfig:
         Returns:
             systemd-networkd configuration string
         """
-        config_lines = ["[Match]", f"Name={self.interface}", "", "[Network]"]
+        config = f"[Match]\nName={self.interface}\n\n[Network]"
 
         if self.network_type == "dhcp":
-            config_lines.append("DHCP=yes")
+            config += "\nDHCP=yes"
         elif self.network_type == "static":
-            config_lines.extend(
-                [
-                    f"Address={self.ip_address}/{self._netmask_to_cidr()}",
-                    f"Gateway={self.gateway}",
-                ]
+            config += (
+                f"\nAddress={self.ip_address}/{self._netmask_to_cidr()}"
+                f"\nGateway={self.gateway}"
             )
             if self.dns_servers:
-                config_lines.append(f"DNS={self.dns_servers}")
+                config += f"\nDNS={self.dns_servers}"
 
         if self.domain_search:
-            config_lines.append(f"Domains={self.domain_search}")
+            config += f"\nDomains={self.domain_search}"
 
-        return "\n".join(config_lines)
+        return config
 
     def _netmask_to_cidr(self) -> str:
         """Convert netmask to CIDR notation.
 
         Returns:
-            CIDR prefix length
+            CIDR prefix length ("24" for a missing or invalid netmask)
         """
-        # Simple conversion for a common netmask
-        netmask_map = {
-            "255.255.255.0": "24",
-            "255.255.0.0": "16",
-            "255.0.0.0": "8",
-            "255.255.255.128": "25",
-            "255.255.255.192": "26",
-            "255.255.255.224": "27",
-            "255.255.255.240": "28",
-            "255.255.255.248": "29",
-            "255.255.255.252": "30",
-        }
-        return netmask_map.get(self.netmask, "24")
-
-
-@dataclass
+        try:
+            mask = int.from_bytes(socket.inet_aton(self.netmask), "big")
+        except OSError:
+            return "24"
+
+        # A valid mask is a run of ones followed by zeros, so the inverted
+        # host part plus one is a power of two
+        host = ~mask & 0xFFFFFFFF
+        if self.netmask.count(".") != 3 or host & (host + 1):
+            return "24"
+        return str(mask.bit_count())
+
+
+@dataclass(slots=True)
 class SystemConfig:
     """Complete system configuration data structure.
 
@@ -178,89 +387,34 @@ class SystemConfig:
     network: NetworkConfig = field(default_factory=NetworkConfig)
     user_password: str = ""
     sudo_nopasswd: bool = False
+    # (checked field values, issues) from the last validate() call
+    _validated: Optional[Tuple[tuple, Tuple[ValidationIssue, ...]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    def validate(self) -> List[ValidationError]:
+    def __post_init__(self) -> None:
+        """Intern the small-cardinality fields so comparisons hit identity."""
+        self.filesystem = _intern(self.filesystem)
+        self.swap_size = _intern(self.swap_size)
+
+    def validate(self) -> List[ValidationIssue]:
         """Comprehensive configuration validation.
 
         Returns:
-            List of validation errors (empty if valid)
+            List of validation issues (empty if valid)
         """
-        errors = []
-
-        # Validate required fields
-        if not self.target_drive:
-            errors.append(
-                ValidationError(
-                    "Target drive is required",
-                    "target_drive",
-                    self.target_drive,
-                    "Valid drive path (e.g., /dev/nvme0n1)",
-                )
-            )
-        elif not self.target_drive.startswith("/dev/"):
-            errors.append(
-                ValidationError(
-                    "Invalid drive path format",
-                    "target_drive",
-                    self.target_drive,
-                    "Path starting with /dev/",
-                )
-            )
-
-        if not self.user_fullname:
-            errors.append(
-                ValidationError(
-                    "User full name is required",
-                    "user_fullname",
-                    self.user_fullname,
-                    "User's full name",
-                )
-            )
-
-        if not self.username:
-            errors.append(
-                ValidationError(
-                    "Username is required",
-                    "username",
-                    self.username,
-                    "Valid Linux username",
-                )
-            )
-        elif not validate_username(self.username):
-            errors.append(
-                ValidationError(
-                    "Invalid username format",
-                    "username",
-                    self.username,
-                    "Lowercase letters, numbers, underscore, starting with letter",
-                )
-            )
-
-        if not self.hostname:
-            errors.append(
-                ValidationError(
-                    "Hostname is required", "hostname", self.hostname, "Valid hostname"
-                )
-            )
-        elif not validate_hostname(self.hostname):
-            errors.append(
-                ValidationError(
-                    "Invalid hostname format",
-                    "hostname",
-                    self.hostname,
-                    "Letters, numbers, hyphens, no spaces",
-                )
-            )
-
-        if not validate_locale(self.locale):
-            errors.append(
-                ValidationError(
-                    "Invalid locale format",
-                    "locale",
-                    self.locale,
-                    "Format: xx_XX.UTF-8",
-                )
-            )
+        key = (
+            self.target_drive,
+            self.user_fullname,
+            self.username,
+            self.hostname,
+            self.locale,
+            self.swap_size,
+        )
+        memo = self._validated
+        if memo is None or memo[0] != key:
+            memo = self._validated = (key, _validate_system(*key))
+        errors = list(memo[1])
 
         # Validate network configuration
         errors.extend(self.network.validate())
@@ -273,76 +427,63 @@ class SystemConfig:
         Returns:
             Dictionary representation of configuration
         """
-        return {
-            "target_drive": self.target_drive,
-            "locale": self.locale,
-            "timezone": self.timezone,
-            "user_fullname": self.user_fullname,
-            "username": self.username,
-            "hostname": self.hostname,
-            "swap_size": self.swap_size,
-            "filesystem": self.filesystem,
-            "network": {
-                "network_type": self.network.network_type,
-                "interface": self.network.interface,
-                "ip_address": self.network.ip_address,
-                "netmask": self.network.netmask,
-                "gateway": self.network.gateway,
-                "dns_servers": self.network.dns_servers,
-                "domain_search": self.network.domain_search,
-                "dns_suffix": self.network.dns_suffix,
-            },
-            "user_password": self.user_password,
-            "sudo_nopasswd": self.sudo_nopasswd,
-        }
+        network = self.network
+        data = {name: getattr(self, name) for name in _SYSTEM_FIELDS}
+        data["network"] = {name: getattr(network, name) for name in _NETWORK_FIELDS}
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> SystemConfig:
         """Deserialize configuration from a dictionary.
 
         Args:
-            data: Dictionary containing configuration data
+            data: Dictionary containing configuration data; "network" may
+                already be a NetworkConfig (see _network_object_hook)
 
         Returns:
             SystemConfig instance
         """
-        network_data = data.get("network", {})
-        network = NetworkConfig(
-            network_type=network_data.get("network_type", "dhcp"),
-            interface=network_data.get("interface", "eth0"),
-            ip_address=network_data.get("ip_address", ""),
-            netmask=network_data.get("netmask", ""),
-            gateway=network_data.get("gateway", ""),
-            dns_servers=network_data.get("dns_servers", ""),
-            domain_search=network_data.get("domain_search", ""),
-            dns_suffix=network_data.get("dns_suffix", ""),
-        )
+        network = data.get("network", {})
+        if not isinstance(network, NetworkConfig):
+            network = _network_from_dict(network)
+        # Defaults are merged in once and all values fetched in one C call
+        return cls(*_system_values({**_SYSTEM_DEFAULTS, **data, "network": network}))
 
-        return cls(
-            target_drive=data.get("target_drive", ""),
-            locale=data.get("locale", "en_US.UTF-8"),
-            timezone=data.get("timezone", "America/New_York"),
-            user_fullname=data.get("user_fullname", ""),
-            username=data.get("username", ""),
-            hostname=data.get("hostname", ""),
-            swap_size=data.get("swap_size", "auto"),
-            filesystem=data.get("filesystem", "ext4"),
-            network=network,
-            user_password=data.get("user_password", ""),
-            sudo_nopasswd=data.get("sudo_nopasswd", False),
-        )
-
-    def save_to_file(self, file_path: str) -> None:
+    def save_to_file(self, file_path: str, compact: bool = False) -> None:
         """Save configuration to file.
 
         Args:
             file_path: Path to save a configuration file
+            compact: Write minified JSON instead of the indented, human-readable
+                layout (stays on the C encoder's fast path)
         """
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2)
-
-        # Set appropriate file permissions (600)
-        os.chmod(file_path, 0o600)
+        orjson = _load_orjson() if USE_ORJSON else None
+        if orjson is not None:
+            # orjson serializes the dataclasses directly, no to_dict() pass
+            option = 0 if compact else orjson.OPT_INDENT_2
+            data = orjson.dumps(self, option=option)
+        else:
+            import json
+
+            if compact:
+                text = json.dumps(self.to_dict(), separators=(",", ":"))
+            else:
+                text = json.dumps(self.to_dict(), indent=2)
+            data = text.encode("utf-8")
+
+        # Write a 600 temp file and rename it into place, so the configuration
+        # is never readable by others or seen half-written
+        tmp_path = f"{file_path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                os.fchmod(fd, 0o600)  # In case a stale temp file was reused
+                f.write(data)
+            os.replace(tmp_path, file_path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
 
     @classmethod
     def load_from_file(cls, file_path: str) -> SystemConfig:
@@ -356,25 +497,87 @@ class SystemConfig:
 
         Raises:
             FileNotFoundError: If a file doesn't exist
-            json.JSONDecodeError: If a file contains invalid JSON
+            json.JSONDecodeError: If a file contains invalid JSON (orjson's
+                JSONDecodeError when USE_ORJSON is enabled)
         """
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        orjson = _load_orjson() if USE_ORJSON else None
+        if orjson is not None:
+            with open(file_path, "rb") as f:
+                data = orjson.loads(f.read())
+        else:
+            import json
+
+            with open(file_path, "r", encoding="utf-8") as f:
+                data = json.load(f, object_hook=_network_object_hook)
 
         return cls.from_dict(data)
 
 
-@dataclass
+# Field names in declaration order, resolved once for serialization;
+# internal init=False fields such as the validation memo are left out
+_NETWORK_FIELDS: Tuple[str, ...] = tuple(
+    f.name for f in fields(NetworkConfig) if f.init
+)
+_SYSTEM_FIELDS: Tuple[str, ...] = tuple(
+    f.name for f in fields(SystemConfig) if f.init
+)
+
+# Field defaults and positional value getters used by SystemConfig.from_dict
+_NETWORK_DEFAULTS: Dict[str, Any] = {
+    f.name: f.default
+    for f in fields(NetworkConfig)
+    if f.init and f.default is not MISSING
+}
+_SYSTEM_DEFAULTS: Dict[str, Any] = {
+    f.name: f.default
+    for f in fields(SystemConfig)
+    if f.init and f.default is not MISSING
+}
+_network_values = operator.itemgetter(*_NETWORK_FIELDS)
+_system_values = operator.itemgetter(*_SYSTEM_FIELDS)
+
+
+def _network_from_dict(data: Dict[str, Any]) -> NetworkConfig:
+    """Build a NetworkConfig from a dictionary, using defaults for missing keys.
+
+    Args:
+        data: Dictionary containing network configuration data
+
+    Returns:
+        NetworkConfig instance
+    """
+    return NetworkConfig(*_network_values({**_NETWORK_DEFAULTS, **data}))
+
+
+def _network_object_hook(data: Dict[str, Any]) -> Any:
+    """json object_hook that builds the network section while parsing.
+
+    Args:
+        data: Decoded JSON object
+
+    Returns:
+        NetworkConfig for the network section, otherwise the object unchanged
+    """
+    if "network_type" in data:
+        return _network_from_dict(data)
+    return data
+
+
+@dataclass(frozen=True)
 class Drive:
     """Represents a storage drive.
 
+    Immutable, so instances (including the shared dry-run fixtures) can be
+    handed out without copying. Not slotted: is_suitable_for_installation
+    caches into the instance dict.
+
     Attributes:
         path: Device path (e.g., "/dev/nvme0n1")
         size_gb: Drive size in gigabytes
         model: Drive model name
         is_removable: Whether drive is removable
         has_windows: Windows installation detected
-        partitions: List of partition information
+        partitions: Partition information
         health_status: Drive health information
     """
 
@@ -383,11 +586,14 @@ class Drive:
     model: str
     is_removable: bool = False
     has_windows: bool = False
-    partitions: List[str] = field(default_factory=list)
+    partitions: Tuple[str, ...] = ()
     health_status: str = "unknown"
 
+    @functools.cached_property
     def is_suitable_for_installation(self) -> bool:
-        """Check if the drive is suitable for installation.
+        """Whether the drive is suitable for installation.
+
+        Computed on first access and cached on the instance.
 
         Returns:
             True if the drive is suitable for installation
@@ -417,10 +623,12 @@ class Drive:
         return f"{self.path}: {self.model} - {self.size_gb}GB{status_str}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WindowsDetectionResult:
     """Result of Windows detection on a drive.
 
+    Immutable, so cached and dry-run results can be shared safely.
+
     Attributes:
         has_windows: Windows detected
         confidence_level: "high", "medium", "low"
@@ -431,12 +639,18 @@ class WindowsDetectionResult:
 
     has_windows: bool
     confidence_level: str
-    detection_methods: List[str] = field(default_factory=list)
+    detection_methods: Tuple[str, ...] = ()
     windows_version: str = ""
-    boot_entries: List[str] = field(default_factory=list)
+    boot_entries: Tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        """Intern the confidence level so comparisons hit identity."""
+        object.__setattr__(
+            self, "confidence_level", _intern(self.confidence_level)
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class EfiEntry:
     """Represents an EFI boot entry.
 
@@ -5,71 +5,27 @@ including IP addresses, usernames, hostnames, and locales.
 """
 
 import re
-
-
-def validate_ip_address(ip_string: str) -> bool:
-    """Validate an IP address format.
-
-    Args:
-        ip_string: IP address to validate
-
-    Returns:
-        True if the IP address is valid, False otherwise
-    """
-    if not ip_string:
-        return False
-
-    # IPv4 validation
-    ipv4_pattern = r"^(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})$"
-    match = re.match(ipv4_pattern, ip_string)
-
-    if not match:
-        return False
-
-    # Check each octet is in valid range (0-255)
-    for octet in match.groups():
-        if not (0 <= int(octet) <= 255):
-            return False
-
-    # Check it's not a network or broadcast address
-    octets = [int(x) for x in match.groups()]
-
-    # Avoid reserved ranges
-    if octets[0] == 0 or octets[0] == 127:  # 0.x.x.x or 127.x.x.x
-        return False
-
-    if octets[0] >= 224:  # Multicast and reserved
-        return False
-
-    return True
-
-
-def validate_username(username: str) -> bool:
-    """Validate Linux username.
-
-    Args:
-        username: Username to validate
-
-    Returns:
-        True if the username is valid, False otherwise
-    """
-    if not username:
-        return False
-
-    # Length limits (1-32 characters)
-    if not (1 <= len(username) <= 32):
-        return False
-
-    # Must start with a letter or underscore
-    if not (username[0].isalpha() or username[0] == "_"):
-        return False
-
-    # Can contain letters, numbers, underscores, hyphens
-    if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_-]*$", username):
-        return False
-
-    # Check for reserved usernames
-    reserved_names = {
+import string
+from typing import Tuple
+
+# Patterns are compiled once at import so validators in prompt retry loops
+# only run the match
+_RE_LOCALE = re.compile(r"^[a-z]{2}_[A-Z]{2}\.UTF-8$")
+_RE_TIMEZONE = re.compile(r"^[A-Z][a-zA-Z_]*\/[A-Z][a-zA-Z_]*$")
+_RE_DRIVE_PATH = re.compile(
+    r"^/dev/sd[a-z]$"  # SATA/SCSI drives (sda, sdb, etc.)
+    r"|^/dev/nvme\d+n\d+$"  # NVMe drives (nvme0n1, nvme1n1, etc.)
+)
+_RE_SWAP_SIZE = re.compile(r"^\d+[KMG]?$")
+
+# Deletion tables for single-pass character-set checks: a string made only
+# of allowed characters translates to ""
+_USERNAME_CHARS = str.maketrans("", "", string.ascii_letters + string.digits + "_-")
+_HOSTNAME_CHARS = str.maketrans("", "", string.ascii_letters + string.digits + "-.")
+
+# System and service account names that may not be used for the primary user
+_RESERVED_USERNAMES = frozenset(
+    {
         "root",
         "bin",
         "daemon",
@@ -131,72 +87,11 @@ def validate_username(username: str) -> bool:
         "user",
         "default",
     }
+)
 
-    if username.lower() in reserved_names:
-        return False
-
-    return True
-
-
-def validate_hostname(hostname: str) -> bool:
-    """Validate system hostname.
-
-    Args:
-        hostname: Hostname to validate
-
-    Returns:
-        True if the hostname is valid, False otherwise
-    """
-    if not hostname:
-        return False
-
-    # Length restrictions (1-253 characters total)
-    if not (1 <= len(hostname) <= 253):
-        return False
-
-    # Split into labels (parts separated by dots)
-    labels = hostname.split(".")
-
-    for label in labels:
-        # Each label must be 1-63 characters
-        if not (1 <= len(label) <= 63):
-            return False
-
-        # Must not start or end with hyphen
-        if label.startswith("-") or label.endswith("-"):
-            return False
-
-        # Can only contain letters, numbers, hyphens
-        if not re.match(r"^[a-zA-Z0-9-]+$", label):
-            return False
-
-        # Must not be all numeric (to avoid confusion with IP addresses)
-        if label.isdigit():
-            return False
-
-    return True
-
-
-def validate_locale(locale_string: str) -> bool:
-    """Validate locale format.
-
-    Args:
-        locale_string: Locale to validate
-
-    Returns:
-        True if locale is valid, False otherwise
-    """
-    if not locale_string:
-        return False
-
-    # Format validation (xx_XX.UTF-8)
-    locale_pattern = r"^[a-z]{2}_[A-Z]{2}\.UTF-8$"
-
-    if not re.match(locale_pattern, locale_string):
-        return False
-
-    # Check for common valid locales
-    valid_locales = {
+# Locales the installer knows how to configure
+_VALID_LOCALES = frozenset(
+    {
         "en_US.UTF-8",
         "en_GB.UTF-8",
         "en_CA.UTF-8",
@@ -248,31 +143,11 @@ def validate_locale(locale_string: str) -> bool:
         "gd_GB.UTF-8",
         "gv_GB.UTF-8",
     }
+)
 
-    # Check against known valid locales
-    return locale_string in valid_locales
-
-
-def validate_timezone(timezone_string: str) -> bool:
-    """Validate timezone format.
-
-    Args:
-        timezone_string: Timezone to validate
-
-    Returns:
-        True if timezone is valid, False otherwise
-    """
-    if not timezone_string:
-        return False
-
-    # Basic format validation (Area/Location)
-    timezone_pattern = r"^[A-Z][a-zA-Z_]*\/[A-Z][a-zA-Z_]*$"
-
-    if not re.match(timezone_pattern, timezone_string):
-        return False
-
-    # Check for common valid timezones
-    valid_timezones = {
+# Timezones offered by the installer
+_VALID_TIMEZONES = frozenset(
+    {
         "America/New_York",
         "America/Chicago",
         "America/Denver",
@@ -337,9 +212,169 @@ def validate_timezone(timezone_string: str) -> bool:
         "Africa/Tunis",
         "Africa/Algiers",
     }
+)
+
+
+def validate_ip_address(ip_string: str) -> bool:
+    """Validate an IP address format.
+
+    Args:
+        ip_string: IP address to validate
+
+    Returns:
+        True if the IP address is valid, False otherwise
+    """
+    if not ip_string:
+        return False
+
+    # Dotted-quad decimal only; octets are parsed base 10 so a leading zero
+    # is not read as octal
+    parts = ip_string.split(".")
+    if len(parts) != 4:
+        return False
+
+    for part in parts:
+        if not (part.isascii() and part.isdigit() and len(part) <= 3):
+            return False
+        # Check each octet is in valid range (0-255)
+        if int(part, 10) > 255:
+            return False
+
+    first_octet = int(parts[0], 10)
+
+    # Avoid reserved ranges
+    if first_octet == 0 or first_octet == 127:  # 0.x.x.x or 127.x.x.x
+        return False
+
+    if first_octet >= 224:  # Multicast and reserved
+        return False
+
+    return True
+
+
+def validate_ip_addresses(*ip_strings: str) -> Tuple[bool, ...]:
+    """Validate several IP addresses in one call.
+
+    Applies the same rules as validate_ip_address, for callers that check
+    related addresses (e.g. address and gateway) together.
+
+    Args:
+        *ip_strings: IP addresses to validate
+
+    Returns:
+        Tuple with one result per address, in argument order
+    """
+    return tuple(map(validate_ip_address, ip_strings))
+
+
+def validate_username(username: str) -> bool:
+    """Validate Linux username.
+
+    Args:
+        username: Username to validate
+
+    Returns:
+        True if the username is valid, False otherwise
+    """
+    if not username:
+        return False
+
+    # Length limits (1-32 characters)
+    if not (1 <= len(username) <= 32):
+        return False
+
+    # Must start with a letter or underscore
+    if not (username[0].isalpha() or username[0] == "_"):
+        return False
+
+    # Can contain letters, numbers, underscores, hyphens
+    if username.translate(_USERNAME_CHARS):
+        return False
+
+    # Check for reserved usernames
+    if username.lower() in _RESERVED_USERNAMES:
+        return False
+
+    return True
+
+
+def validate_hostname(hostname: str) -> bool:
+    """Validate system hostname.
+
+    Args:
+        hostname: Hostname to validate
+
+    Returns:
+        True if the hostname is valid, False otherwise
+    """
+    if not hostname:
+        return False
+
+    # Length restrictions (1-253 characters total)
+    if not (1 <= len(hostname) <= 253):
+        return False
+
+    # Can only contain letters, numbers, hyphens and label-separating dots
+    if hostname.translate(_HOSTNAME_CHARS):
+        return False
+
+    # Split into labels (parts separated by dots)
+    labels = hostname.split(".")
+
+    for label in labels:
+        # Each label must be 1-63 characters
+        if not (1 <= len(label) <= 63):
+            return False
+
+        # Must not start or end with hyphen
+        if label.startswith("-") or label.endswith("-"):
+            return False
+
+        # Must not be all numeric (to avoid confusion with IP addresses)
+        if label.isdigit():
+            return False
+
+    return True
+
+
+def validate_locale(locale_string: str) -> bool:
+    """Validate locale format.
+
+    Args:
+        locale_string: Locale to validate
+
+    Returns:
+        True if locale is valid, False otherwise
+    """
+    if not locale_string:
+        return False
+
+    # Format validation (xx_XX.UTF-8)
+    if not _RE_LOCALE.match(locale_string):
+        return False
+
+    # Check against known valid locales
+    return locale_string in _VALID_LOCALES
+
+
+def validate_timezone(timezone_string: str) -> bool:
+    """Validate timezone format.
+
+    Args:
+        timezone_string: Timezone to validate
+
+    Returns:
+        True if timezone is valid, False otherwise
+    """
+    if not timezone_string:
+        return False
+
+    # Basic format validation (Area/Location)
+    if not _RE_TIMEZONE.match(timezone_string):
+        return False
 
     # Check against known valid timezones
-    return timezone_string in valid_timezones
+    return timezone_string in _VALID_TIMEZONES
 
 
 def validate_drive_path(drive_path: str) -> bool:
@@ -359,12 +394,7 @@ def validate_drive_path(drive_path: str) -> bool:
         return False
 
     # Internal drive patterns only (no removable/virtual devices)
-    valid_patterns = [
-        r"^/dev/sd[a-z]$",  # SATA/SCSI drives (sda, sdb, etc.)
-        r"^/dev/nvme\d+n\d+$",  # NVMe drives (nvme0n1, nvme1n1, etc.)
-    ]
-
-    return any(re.match(pattern, drive_path) for pattern in valid_patterns)
+    return _RE_DRIVE_PATH.match(drive_path) is not None
 
 
 def validate_swap_size(swap_size: str) -> bool:
@@ -384,9 +414,7 @@ def validate_swap_size(swap_size: str) -> bool:
         return True
 
     # Validate size with units (e.g., "2G", "512M", "1024K")
-    size_pattern = r"^\d+[KMG]?$"
-
-    if not re.match(size_pattern, swap_size.upper()):
+    if not _RE_SWAP_SIZE.match(swap_size.upper()):
         return False
 
     # Extract numeric value
@@ -9,17 +9,175 @@ configuration management, and dual-boot protection.
 
 from __future__ import annotations
 
+import functools
 import os
+import shlex
+import shutil
+import stat
 import sys
+import threading
 from abc import ABC, abstractmethod
-from typing import List  # TODO: Add Optional back when needed
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple, Type, Union
 
 from helpers.command import CommandExecutor
+from helpers.exceptions import CommandExecutionError
+from helpers.hardware import HardwareManager, _list_partitions, _partition_path
 # TODO: Add back when implementing proper error handling
 # from helpers.exceptions import InstallerError, ValidationError
 from helpers.logging import get_logger, initialize_logging
 from helpers.models import SystemConfig
 
+# Packages Phase 1 installs into the live environment
+_REQUIRED_PACKAGES = ("parted", "gdisk", "dosfstools", "e2fsprogs", "zfsutils-linux")
+
+
+@functools.lru_cache(maxsize=1)
+def _uefi_present() -> bool:
+    """Check whether the system was booted in UEFI mode.
+
+    The firmware mode cannot change while running, so the probe is cached;
+    call _uefi_present.cache_clear() to force a re-check.
+
+    Returns:
+        True if /sys/firmware/efi exists
+    """
+    return os.path.isdir("/sys/firmware/efi")
+
+
+# Root filesystems that cannot host a swap file at all
+_NO_SWAPFILE_FILESYSTEMS = frozenset({"zfs"})
+
+# Swap file size used when the configuration asks for "auto"
+_AUTO_SWAP_SIZE = "4G"
+
+
+# Seconds a single chroot setup mount may take before setup gives up
+_MOUNT_TIMEOUT = 60
+
+
+# Bytes requested per copy_file_range/sendfile call (the kernel caps a single
+# call just under 2GiB)
+_COPY_CHUNK = 1 << 30
+
+# Live system images, casper (Ubuntu/KDE neon) first, then Debian live-boot
+_SQUASHFS_IMAGES = (
+    "/cdrom/casper/filesystem.squashfs",
+    "/run/live/medium/live/filesystem.squashfs",
+)
+
+# Where the live system image is mounted while it is copied
+_SQUASHFS_MOUNT = "/run/slit/rootfs"
+
+
+def _copy_file_data(src: str, dst: str) -> None:
+    """Copy one file's contents in kernel space.
+
+    Data moves page cache to page cache with copy_file_range (a reflink or
+    server-side copy where the filesystem supports it), falling back to
+    sendfile when the kernel or filesystem pair rejects it.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        try:
+            while os.copy_file_range(in_fd, out_fd, _COPY_CHUNK):
+                pass
+        except OSError:
+            # Both calls advance the file offsets, so sendfile resumes where
+            # copy_file_range stopped (EXDEV, ENOSYS, EINVAL, ...)
+            while os.sendfile(out_fd, in_fd, None, _COPY_CHUNK):
+                pass
+
+
+def _copy_metadata(src: str, dst: str, st: os.stat_result) -> None:
+    """Copy ownership, then mode, times and extended attributes.
+
+    Ownership goes first: chown clears the setuid/setgid bits and file
+    capabilities, which copystat then restores.
+
+    Args:
+        src: Source path
+        dst: Destination path
+        st: lstat result of src
+    """
+    os.lchown(dst, st.st_uid, st.st_gid)
+    shutil.copystat(src, dst, follow_symlinks=False)
+
+
+def _copy_tree(src: str, dst: str) -> None:
+    """Copy a directory tree, top-level entries in parallel.
+
+    Large-file copies are I/O bound and NVMe drives serve several queues at
+    once, so each top-level entry is copied on its own worker thread.
+    Ownership, modes, times, extended attributes, symlinks, hardlinks and
+    device nodes are preserved. Directories that already exist under dst
+    (mount points such as /boot/efi) keep their own attributes.
+
+    Args:
+        src: Source directory
+        dst: Destination directory (created if missing)
+
+    Raises:
+        OSError: If any entry could not be copied
+    """
+    # First destination path of each multiply-linked source inode
+    links: Dict[Tuple[int, int], str] = {}
+    links_lock = threading.Lock()
+
+    def copy_entry(source: str, target: str) -> None:
+        st = os.lstat(source)
+        mode = st.st_mode
+
+        if stat.S_ISDIR(mode):
+            try:
+                os.mkdir(target)
+            except FileExistsError:
+                created = False
+            else:
+                created = True
+            with os.scandir(source) as entries:
+                for entry in entries:
+                    copy_entry(entry.path, os.path.join(target, entry.name))
+            # After the contents, so their creation does not reset the times
+            if created:
+                _copy_metadata(source, target, st)
+            return
+
+        if stat.S_ISREG(mode) and st.st_nlink > 1:
+            with links_lock:
+                first = links.get((st.st_dev, st.st_ino))
+                if first is None:
+                    links[(st.st_dev, st.st_ino)] = target
+                    # Create it before releasing the lock so later links
+                    # always find the inode
+                    open(target, "wb").close()
+            if first is not None:
+                os.link(first, target)
+                return
+
+        if stat.S_ISREG(mode):
+            _copy_file_data(source, target)
+        elif stat.S_ISLNK(mode):
+            os.symlink(os.readlink(source), target)
+        else:
+            # Device nodes, FIFOs and sockets
+            os.mknod(target, mode, st.st_rdev)
+        _copy_metadata(source, target, st)
+
+    os.makedirs(dst, exist_ok=True)
+
+    with ThreadPoolExecutor() as executor:
+        futures = [
+            executor.submit(copy_entry, entry.path, os.path.join(dst, entry.name))
+            for entry in os.scandir(src)
+        ]
+        for future in futures:
+            future.result()
+
 
 class InstallationPhase(ABC):
     """Base class for all installation phases.
@@ -33,6 +191,7 @@ class InstallationPhase(ABC):
         config: SystemConfig,
         command_executor: CommandExecutor,
         dry_run: bool = False,
+        hardware_manager: Optional[HardwareManager] = None,
     ) -> None:
         """Initialize the installation phase.
 
@@ -40,10 +199,13 @@ class InstallationPhase(ABC):
             config: System configuration object
             command_executor: Command executor for system operations
             dry_run: If True, simulate operations without making changes
+            hardware_manager: Hardware manager whose cached detection results
+                are dropped when this phase changes disks or boot entries
         """
         self.config = config
         self.command_executor = command_executor
         self.dry_run = dry_run
+        self.hardware_manager = hardware_manager
         self.logger = get_logger(self.__class__.__name__)
         self.phase_name = self.__class__.__name__.replace("Phase", "")
         self.install_root = "/target"
@@ -72,6 +234,35 @@ class InstallationPhase(ABC):
             self.logger.error(f"Phase {self.phase_name} failed with exception: {e}")
             return False
 
+    def _execute_concurrently(
+        self,
+        commands: Sequence[Tuple[Union[str, List[str]], str]],
+        timeout: Optional[int] = None,
+    ) -> bool:
+        """Run independent commands at the same time.
+
+        Args:
+            commands: (command, description) pairs with no ordering between them
+            timeout: Per-command timeout in seconds
+
+        Returns:
+            True if every command succeeded
+        """
+        execute = functools.partial(
+            self.command_executor.execute_command, timeout=timeout
+        )
+        with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+            futures = [
+                executor.submit(execute, command, description)
+                for command, description in commands
+            ]
+            return all([future.result().success for future in futures])
+
+    def _invalidate_hardware_cache(self) -> None:
+        """Drop cached blkid, efibootmgr and Windows detection results."""
+        if self.hardware_manager is not None:
+            self.hardware_manager.clear_cache()
+
     def _log_phase_start(self) -> None:
         """Log the start of the phase with appropriate formatting."""
         separator = "=" * 50
@@ -119,9 +310,13 @@ class SystemPreparationPhase(InstallationPhase):
 
     def _execute_phase(self) -> bool:
         """Execute system preparation phase."""
+        # Local stat only; checked first so nothing is installed on a machine
+        # that cannot be used anyway
         if not self._check_uefi():
             return False
 
+        # Gate on connectivity so the live system is left untouched when the
+        # network is down
         if not self._check_network():
             return False
 
@@ -138,7 +333,7 @@ class SystemPreparationPhase(InstallationPhase):
             print("  [DRY-RUN] Would check /sys/firmware/efi directory")
             return True
 
-        if not os.path.exists("/sys/firmware/efi"):
+        if not _uefi_present():
             self.logger.error("UEFI boot mode not detected")
             print("ERROR: UEFI boot mode required")
             return False
@@ -171,24 +366,24 @@ class SystemPreparationPhase(InstallationPhase):
         """Install required system packages."""
         self.logger.info("Installing required packages")
 
-        packages = ["parted", "gdisk", "dosfstools", "e2fsprogs", "zfsutils-linux"]
+        packages = " ".join(_REQUIRED_PACKAGES)
 
         if self.dry_run:
-            print(f"  [DRY-RUN] Would install packages: {', '.join(packages)}")
+            print(
+                f"  [DRY-RUN] Would install packages: {', '.join(_REQUIRED_PACKAGES)}"
+            )
             return True
 
-        # Update package database
-        result = self.command_executor.execute_command(
-            "apt-get -qq update", "Updating package database"
-        )
-
-        if not result.success:
-            return False
-
-        # Install packages
-        result = self.command_executor.execute_command(
-            f"apt-get -qq install -y {' '.join(packages)}",
-            "Installing required packages",
+        # Update and install are still two apt-get runs; chaining them in one
+        # shell saves a process spawn and an executor round-trip, and skips
+        # the install if the update failed
+        result = self.command_executor.execute_script(
+            [
+                "apt-get -qq update",
+                "DEBIAN_FRONTEND=noninteractive apt-get -qq install -y "
+                f"--no-install-recommends {packages}",
+            ],
+            "Updating package database and installing required packages",
         )
 
         return result.success
@@ -212,66 +407,42 @@ class PartitioningPhase(InstallationPhase):
         """Execute the partitioning phase."""
         drive = self.config.target_drive
 
-        if not self._create_partition_table(drive):
-            return False
-
-        if not self._create_partitions(drive):
-            return False
+        try:
+            if not self._create_partition_table(drive):
+                return False
 
-        if not self._format_partitions(drive):
-            return False
+            if not self._format_partitions(drive):
+                return False
+        finally:
+            # Partitions and filesystems changed, even on a partial run
+            self._invalidate_hardware_cache()
 
         return True
 
     def _create_partition_table(self, drive: str) -> bool:
-        """Create a GPT partition table."""
-        self.logger.info(f"Creating GPT partition table on {drive}")
+        """Create a GPT partition table with EFI and root partitions."""
+        self.logger.info(f"Creating GPT partition table and partitions on {drive}")
 
         if self.dry_run:
             print(f"  [DRY-RUN] Would create GPT partition table on {drive}")
-            return True
-
-        # Unmount any existing partitions
-        self.command_executor.execute_command(
-            f"umount {drive}p* 2>/dev/null || true", "Unmounting existing partitions"
-        )
-
-        # Create a GPT partition table
-        result = self.command_executor.execute_command(
-            f"parted -s {drive} mklabel gpt", "Creating GPT partition table"
-        )
-
-        return result.success
-
-    def _create_partitions(self, drive: str) -> bool:
-        """Create EFI and root partitions."""
-        self.logger.info("Creating partitions")
-
-        if self.dry_run:
             print("  [DRY-RUN] Would create EFI (512MB) and root partitions")
             return True
 
-        # Create an EFI system partition (512MB)
-        result = self.command_executor.execute_command(
-            f"parted -s {drive} mkpart primary fat32 1MiB 513MiB",
-            "Creating EFI system partition",
-        )
-
-        if not result.success:
-            return False
-
-        # Set EFI system partition flag
-        result = self.command_executor.execute_command(
-            f"parted -s {drive} set 1 esp on", "Setting EFI system partition flag"
-        )
-
-        if not result.success:
-            return False
+        # Unmount any existing partitions; ones that are not mounted just fail
+        for partition in _list_partitions(drive) or ():
+            self.command_executor.execute_command(
+                ["umount", partition],
+                f"Unmounting {partition}",
+                check_success=False,
+            )
 
-        # Create the root partition (remaining space)
+        # One parted run opens the device, rewrites the GPT and syncs once:
+        # label, EFI system partition (512MB) with its flag, then root
         result = self.command_executor.execute_command(
-            f"parted -s {drive} mkpart primary ext4 513MiB 100%",
-            "Creating root partition",
+            f"parted -s {drive} mklabel gpt "
+            "mkpart primary fat32 1MiB 513MiB set 1 esp on "
+            "mkpart primary ext4 513MiB 100%",
+            "Creating GPT partition table and partitions",
         )
 
         return result.success
@@ -292,21 +463,21 @@ class PartitioningPhase(InstallationPhase):
         if not result.success:
             return False
 
-        # Format EFI partition
-        result = self.command_executor.execute_command(
-            f"mkfs.fat -F32 -n EFI {drive}p1", "Formatting EFI partition"
+        # The partitions are disjoint, so format both at once; the multi-second
+        # ext4 run hides the FAT one
+        return self._execute_concurrently(
+            [
+                (
+                    ["mkfs.fat", "-F32", "-n", "EFI", _partition_path(drive, 1)],
+                    "Formatting EFI partition",
+                ),
+                (
+                    ["mkfs.ext4", "-F", "-L", "ROOT", _partition_path(drive, 2)],
+                    "Formatting root partition",
+                ),
+            ]
         )
 
-        if not result.success:
-            return False
-
-        # Format root partition
-        result = self.command_executor.execute_command(
-            f"mkfs.ext4 -F -L ROOT {drive}p2", "Formatting root partition"
-        )
-
-        return result.success
-
 
 class SystemInstallationPhase(InstallationPhase):
     """Phase 3: System file installation.
@@ -340,39 +511,35 @@ class SystemInstallationPhase(InstallationPhase):
         """Mount root and EFI filesystems."""
         self.logger.info("Mounting filesystems")
 
+        root = self.install_root
+        efi = f"{root}/boot/efi"
+        efi_part = _partition_path(drive, 1)
+        root_part = _partition_path(drive, 2)
+
         if self.dry_run:
-            print(f"  [DRY-RUN] Would mount {drive}p2 at {self.install_root}")
-            print(f"  [DRY-RUN] Would mount {drive}p1 at {self.install_root}/boot/efi")
+            print(f"  [DRY-RUN] Would mount {root_part} at {root}")
+            print(f"  [DRY-RUN] Would mount {efi_part} at {efi}")
             return True
 
-        # Create and mount root
-        result = self.command_executor.execute_command(
-            f"mkdir -p {self.install_root}", "Creating installation root"
-        )
-
-        if not result.success:
-            return False
-
-        result = self.command_executor.execute_command(
-            f"mount {drive}p2 {self.install_root}", "Mounting root partition"
-        )
-
-        if not result.success:
-            return False
-
-        # Create and mount EFI
-        result = self.command_executor.execute_command(
-            f"mkdir -p {self.install_root}/boot/efi", "Creating EFI mount point"
-        )
-
-        if not result.success:
+        # Each step is its own argv command, so no value is shell-parsed;
+        # execute_command raises on failure, stopping at the first error
+        try:
+            self.command_executor.execute_command(
+                ["mkdir", "-p", root], "Creating install root"
+            )
+            self.command_executor.execute_command(
+                ["mount", root_part, root], "Mounting root partition"
+            )
+            self.command_executor.execute_command(
+                ["mkdir", "-p", efi], "Creating EFI mount point"
+            )
+            self.command_executor.execute_command(
+                ["mount", efi_part, efi], "Mounting EFI partition"
+            )
+        except CommandExecutionError:
             return False
 
-        result = self.command_executor.execute_command(
-            f"mount {drive}p1 {self.install_root}/boot/efi", "Mounting EFI partition"
-        )
-
-        return result.success
+        return True
 
     def _copy_system_files(self) -> bool:
         """Copy system files from a live environment."""
@@ -382,42 +549,100 @@ class SystemInstallationPhase(InstallationPhase):
             print("  [DRY-RUN] Would copy system files from squashfs")
             return True
 
-        # TODO: Implement squashfs detection and mounting
-        # TODO: Implement rsync system file copying with progress
-        # TODO: Handle casper filesystem detection from multiple sources
-        print("  Copying system files (this would take several minutes)")
+        image = next((p for p in _SQUASHFS_IMAGES if os.path.isfile(p)), None)
+        if image is None:
+            self.logger.error(
+                f"No live system image found (looked for {', '.join(_SQUASHFS_IMAGES)})"
+            )
+            return False
+
+        try:
+            os.makedirs(_SQUASHFS_MOUNT, exist_ok=True)
+            self.command_executor.execute_command(
+                ["mount", "-o", "loop,ro", "-t", "squashfs", image, _SQUASHFS_MOUNT],
+                "Mounting live system image",
+            )
+        except (OSError, CommandExecutionError) as e:
+            self.logger.error(f"Could not mount live system image: {e}")
+            return False
+
+        print("  Copying system files (this may take several minutes)")
+        try:
+            _copy_tree(_SQUASHFS_MOUNT, self.install_root)
+        except OSError as e:
+            self.logger.error(f"System file copy failed: {e}")
+            return False
+        finally:
+            self.command_executor.execute_command(
+                f"umount {_SQUASHFS_MOUNT}",
+                "Unmounting live system image",
+                check_success=False,
+            )
+
         return True
 
     def _create_swap_file(self) -> bool:
         """Create the swap file."""
         self.logger.info("Creating swap file")
 
-        swap_size = getattr(self.config, "swap_size", "4G")
+        swap_size = getattr(self.config, "swap_size", _AUTO_SWAP_SIZE)
+        if swap_size.lower() == "auto":
+            swap_size = _AUTO_SWAP_SIZE
 
         if self.dry_run:
             print(f"  [DRY-RUN] Would create {swap_size} swap file")
             return True
 
-        result = self.command_executor.execute_command(
-            f"fallocate -l {swap_size} {self.install_root}/swapfile",
-            "Creating swap file",
-        )
+        swapfile = f"{self.install_root}/swapfile"
+        fs_type = self._root_filesystem_type()
 
-        if not result.success:
-            return False
+        if fs_type in _NO_SWAPFILE_FILESYSTEMS:
+            # Not fatal, but the installed system will boot without swap, so
+            # tell the user as well as the log
+            message = (
+                f"Swap files are not supported on {fs_type}; "
+                "skipping swap file creation (use a swap partition instead)"
+            )
+            self.logger.warning(message)
+            print(f"  WARNING: {message}")
+            return True
 
-        result = self.command_executor.execute_command(
-            f"chmod 600 {self.install_root}/swapfile", "Setting swap file permissions"
-        )
+        steps = [(["fallocate", "-l", swap_size, swapfile], "Allocating swap file")]
+        if fs_type == "btrfs":
+            # Copy-on-write must be off before any data is allocated
+            steps[:0] = [
+                (["truncate", "-s", "0", swapfile], "Creating empty swap file"),
+                (["chattr", "+C", swapfile], "Disabling copy-on-write"),
+            ]
+        steps += [
+            (["chmod", "600", swapfile], "Restricting swap file permissions"),
+            (["mkswap", swapfile], "Formatting swap file"),
+        ]
 
-        if not result.success:
+        try:
+            for command, description in steps:
+                self.command_executor.execute_command(command, description)
+        except CommandExecutionError:
             return False
 
+        return True
+
+    def _root_filesystem_type(self) -> str:
+        """Return the filesystem type mounted at the install root.
+
+        Falls back to the configured filesystem when detection fails.
+
+        Returns:
+            Filesystem type name as reported by stat (e.g. ``ext2/ext3``)
+        """
         result = self.command_executor.execute_command(
-            f"mkswap {self.install_root}/swapfile", "Formatting swap file"
+            ["stat", "-f", "-c", "%T", self.install_root],
+            "Detecting root filesystem type",
+            check_success=False,
         )
-
-        return result.success
+        if result.success and result.stdout.strip():
+            return result.stdout.strip()
+        return getattr(self.config, "filesystem", "ext4")
 
     def _install_kernel_files(self) -> bool:
         """Install kernel files."""
@@ -454,8 +679,12 @@ class BootloaderConfigurationPhase(InstallationPhase):
         if not self._setup_chroot():
             return False
 
-        if not self._install_grub():
-            return False
+        try:
+            if not self._install_grub():
+                return False
+        finally:
+            # grub-install registers a new EFI boot entry
+            self._invalidate_hardware_cache()
 
         if not self._configure_fstab():
             return False
@@ -472,48 +701,50 @@ class BootloaderConfigurationPhase(InstallationPhase):
             print("  [DRY-RUN] Would bind mount EFI variables")
             return True
 
-        # Bind mount essential filesystems
-        bind_mounts = [
-            ("/proc", f"{self.install_root}/proc"),
-            ("/sys", f"{self.install_root}/sys"),
-            ("/dev", f"{self.install_root}/dev"),
-            ("/run", f"{self.install_root}/run"),
+        root = self.install_root
+
+        # /dev/pts and efivars sit inside the /dev and /sys binds, and /tmp
+        # needs its mount before chmod, so each wave depends on the one before
+        waves = [
+            [
+                (["mount", "--bind", "/proc", f"{root}/proc"], "Binding /proc"),
+                (["mount", "--bind", "/sys", f"{root}/sys"], "Binding /sys"),
+                (["mount", "--bind", "/dev", f"{root}/dev"], "Binding /dev"),
+                (["mount", "--bind", "/run", f"{root}/run"], "Binding /run"),
+                (
+                    ["mount", "-t", "tmpfs", "tmpfs", f"{root}/tmp"],
+                    "Mounting tmpfs for /tmp",
+                ),
+            ],
+            [
+                # Pseudo-terminal support
+                (
+                    ["mount", "--bind", "/dev/pts", f"{root}/dev/pts"],
+                    "Binding /dev/pts",
+                ),
+                (
+                    ["chmod", "1777", f"{root}/tmp"],
+                    "Setting proper permissions on /tmp",
+                ),
+                # EFI variables for GRUB installation
+                (
+                    [
+                        "mount",
+                        "--bind",
+                        "/sys/firmware/efi/efivars",
+                        f"{root}/sys/firmware/efi/efivars",
+                    ],
+                    "Binding EFI variables",
+                ),
+            ],
         ]
 
-        for source, target in bind_mounts:
-            result = self.command_executor.execute_command(
-                f"mount --bind {source} {target}", f"Binding {source}"
-            )
-            if not result.success:
-                return False
-
-        # Mount /dev/pts for pseudo-terminal support
-        result = self.command_executor.execute_command(
-            f"mount --bind /dev/pts {self.install_root}/dev/pts", "Binding /dev/pts"
-        )
-        if not result.success:
-            return False
-
-        # Mount tmpfs for /tmp
-        result = self.command_executor.execute_command(
-            f"mount -t tmpfs tmpfs {self.install_root}/tmp", "Mounting tmpfs for /tmp"
-        )
-        if not result.success:
-            return False
-
-        # Set proper permissions on /tmp
-        result = self.command_executor.execute_command(
-            f"chmod 1777 {self.install_root}/tmp", "Setting proper permissions on /tmp"
-        )
-        if not result.success:
-            return False
-
-        # Bind mount EFI variables for GRUB installation
-        result = self.command_executor.execute_command(
-            f"mount --bind /sys/firmware/efi/efivars {self.install_root}/sys/firmware/efi/efivars",
-            "Binding EFI variables",
-        )
-        if not result.success:
+        try:
+            for commands in waves:
+                if not self._execute_concurrently(commands, timeout=_MOUNT_TIMEOUT):
+                    return False
+        except CommandExecutionError as e:
+            self.logger.error(f"Chroot setup failed: {e}")
             return False
 
         return True
@@ -528,19 +759,15 @@ class BootloaderConfigurationPhase(InstallationPhase):
             print(f"  [DRY-RUN] Would install GRUB on {drive}")
             return True
 
-        # Install GRUB
-        result = self.command_executor.execute_command(
-            f"chroot {self.install_root} grub-install --target=x86_64-efi "
-            f"--efi-directory=/boot/efi --bootloader-id='KDE Neon' {drive}",
-            "Installing GRUB bootloader",
+        # Install GRUB and generate its configuration in one chroot; the
+        # configuration is only generated if the install succeeded
+        script = (
+            "grub-install --target=x86_64-efi --efi-directory=/boot/efi "
+            f"--bootloader-id='KDE Neon' {shlex.quote(drive)} && update-grub"
         )
-
-        if not result.success:
-            return False
-
-        # Generate GRUB configuration
         result = self.command_executor.execute_command(
-            f"chroot {self.install_root} update-grub", "Generating GRUB configuration"
+            ["chroot", self.install_root, "/bin/sh", "-c", script],
+            "Installing and configuring GRUB bootloader",
         )
 
         return result.success
@@ -661,30 +888,33 @@ class SlitInstaller:
     five distinct phases with comprehensive error handling and logging.
     """
 
-    def __init__(self, config: SystemConfig, dry_run: bool = False) -> None:
+    def __init__(
+        self,
+        config: SystemConfig,
+        dry_run: bool = False,
+        hardware_manager: Optional[HardwareManager] = None,
+    ) -> None:
         """Initialize the SLIT installer.
 
         Args:
             config: System configuration object
             dry_run: If True, simulate installation without making changes
+            hardware_manager: Hardware manager used during configuration, so
+                its caches are cleared as phases change disks and boot entries
         """
         self.config = config
         self.dry_run = dry_run
+        self.hardware_manager = hardware_manager
         self.command_executor = CommandExecutor(dry_run=dry_run)
         self.logger = get_logger(__name__)
-        self.phases = self._initialize_phases()
-
-    def _initialize_phases(self) -> List[InstallationPhase]:
-        """Initialize all installation phases in order."""
-        return [
-            SystemPreparationPhase(self.config, self.command_executor, self.dry_run),
-            PartitioningPhase(self.config, self.command_executor, self.dry_run),
-            SystemInstallationPhase(self.config, self.command_executor, self.dry_run),
-            BootloaderConfigurationPhase(
-                self.config, self.command_executor, self.dry_run
-            ),
-            SystemConfigurationPhase(self.config, self.command_executor, self.dry_run),
-        ]
+        # Phases are instantiated one at a time as the install reaches them
+        self.phase_classes: Tuple[Type[InstallationPhase], ...] = (
+            SystemPreparationPhase,
+            PartitioningPhase,
+            SystemInstallationPhase,
+            BootloaderConfigurationPhase,
+            SystemConfigurationPhase,
+        )
 
     def install(self) -> bool:
         """Execute the complete installation process.
@@ -708,9 +938,16 @@ class SlitInstaller:
             return False
 
         # Execute all phases
-        for i, phase in enumerate(self.phases, 1):
-            print(f"\n--- Phase {i} of {len(self.phases)} ---")
-
+        total = len(self.phase_classes)
+        for i, phase_class in enumerate(self.phase_classes, 1):
+            print(f"\n--- Phase {i} of {total} ---")
+
+            phase = phase_class(
+                self.config,
+                self.command_executor,
+                self.dry_run,
+                self.hardware_manager,
+            )
             if not phase.execute():
                 self.logger.error(f"Installation failed at phase {i}")
                 return False
@@ -768,7 +1005,11 @@ def main() -> int:
             return 1
 
         # Create installer with configuration
-        installer = SlitInstaller(config, dry_run=dry_run)
+        installer = SlitInstaller(
+            config,
+            dry_run=dry_run,
+            hardware_manager=config_manager.hardware_manager,
+        )
 
         if installer.install():
             print("\nInstaller scaffold test completed successfully!")
@@ -0,0 +1,10 @@
+"""Unit tests for the SLIT installer."""
+
+import tempfile
+
+from helpers.logging import initialize_logging
+
+# Keep test runs from writing logs into the working directory
+initialize_logging(
+    log_dir=tempfile.mkdtemp(prefix="slit-test-logs-"), console_output=False
+)
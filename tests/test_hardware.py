@@ -0,0 +1,26 @@
+"""Tests for helpers.hardware."""
+
+import unittest
+
+from helpers.hardware import _is_partition_of, _partition_path
+
+
+class PartitionPathTest(unittest.TestCase):
+    """_partition_path follows the kernel's partition naming."""
+
+    def test_plain_and_digit_suffixed_drives(self) -> None:
+        """Only drives whose name ends in a digit get a "p" separator."""
+        cases = (
+            ("/dev/sda", 1, "/dev/sda1"),
+            ("/dev/vdb", 2, "/dev/vdb2"),
+            ("/dev/nvme0n1", 2, "/dev/nvme0n1p2"),
+            ("/dev/mmcblk0", 1, "/dev/mmcblk0p1"),
+        )
+        for drive, number, expected in cases:
+            with self.subTest(drive=drive):
+                self.assertEqual(_partition_path(drive, number), expected)
+                self.assertTrue(_is_partition_of(expected, drive))
+
+
+if __name__ == "__main__":
+    unittest.main()
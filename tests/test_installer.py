@@ -0,0 +1,104 @@
+"""Tests for the installer's system file copy."""
+
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+
+from installer import _copy_tree
+
+
+@unittest.skipUnless(os.geteuid() == 0, "ownership checks need root")
+class CopyTreeTest(unittest.TestCase):
+    """_copy_tree reproduces a system tree's files and metadata."""
+
+    def setUp(self) -> None:
+        """Build a source tree with the entry kinds a root filesystem holds."""
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.src = os.path.join(self.tmp, "src")
+        self.dst = os.path.join(self.tmp, "dst")
+
+        bin_dir = os.path.join(self.src, "usr", "bin")
+        os.makedirs(bin_dir)
+        self._write(os.path.join(bin_dir, "sudo"), b"sudo", 0o4755, 0, 0)
+        self._write(os.path.join(bin_dir, "crontab"), b"cron", 0o2755, 0, 107)
+        self._write(os.path.join(bin_dir, "tool"), b"x" * 70000, 0o755, 1000, 1000)
+        os.link(
+            os.path.join(bin_dir, "tool"), os.path.join(self.src, "tool-link")
+        )
+        os.symlink("usr/bin", os.path.join(self.src, "bin"))
+
+        private = os.path.join(self.src, "home", "user")
+        os.makedirs(private)
+        os.chown(private, 1000, 1000)
+        os.chmod(private, 0o750)
+        os.mkfifo(os.path.join(self.src, "fifo"), 0o600)
+        os.utime(private, (1_000_000, 1_000_000))
+
+    @staticmethod
+    def _write(path: str, data: bytes, mode: int, uid: int, gid: int) -> None:
+        """Create a file with the given contents, owner and mode."""
+        with open(path, "wb") as f:
+            f.write(data)
+        os.chown(path, uid, gid)
+        os.chmod(path, mode)
+
+    def _assert_same(self, relpath: str) -> None:
+        """Check type, mode and owner of one entry against the source."""
+        src_st = os.lstat(os.path.join(self.src, relpath))
+        dst_st = os.lstat(os.path.join(self.dst, relpath))
+        self.assertEqual(stat.S_IFMT(dst_st.st_mode), stat.S_IFMT(src_st.st_mode))
+        self.assertEqual(stat.S_IMODE(dst_st.st_mode), stat.S_IMODE(src_st.st_mode))
+        self.assertEqual((dst_st.st_uid, dst_st.st_gid), (src_st.st_uid, src_st.st_gid))
+
+    def test_setuid_and_setgid_bits_survive(self) -> None:
+        """Ownership is set before the mode, so chown does not clear S_ISUID."""
+        _copy_tree(self.src, self.dst)
+
+        for name, mode in (("sudo", 0o4755), ("crontab", 0o2755)):
+            with self.subTest(name=name):
+                st = os.lstat(os.path.join(self.dst, "usr", "bin", name))
+                self.assertEqual(stat.S_IMODE(st.st_mode), mode)
+                self._assert_same(os.path.join("usr", "bin", name))
+
+    def test_contents_owners_and_modes(self) -> None:
+        """File data, directory owners and modes match the source."""
+        _copy_tree(self.src, self.dst)
+
+        with open(os.path.join(self.dst, "usr", "bin", "tool"), "rb") as f:
+            self.assertEqual(f.read(), b"x" * 70000)
+        for relpath in ("usr/bin/tool", "home/user", "fifo", "bin"):
+            with self.subTest(relpath=relpath):
+                self._assert_same(relpath)
+        self.assertEqual(
+            os.stat(os.path.join(self.dst, "home", "user")).st_mtime, 1_000_000
+        )
+        self.assertEqual(os.readlink(os.path.join(self.dst, "bin")), "usr/bin")
+
+    def test_hardlinks_stay_linked(self) -> None:
+        """Multiply-linked files are copied once and linked, not duplicated."""
+        _copy_tree(self.src, self.dst)
+
+        tool = os.lstat(os.path.join(self.dst, "usr", "bin", "tool"))
+        link = os.lstat(os.path.join(self.dst, "tool-link"))
+        self.assertEqual(tool.st_ino, link.st_ino)
+        self.assertEqual(tool.st_nlink, 2)
+
+    def test_existing_directories_keep_their_attributes(self) -> None:
+        """Pre-existing mount points under dst are not chowned or chmodded."""
+        mount_point = os.path.join(self.dst, "home")
+        os.makedirs(mount_point)
+        os.chmod(mount_point, 0o700)
+        os.makedirs(os.path.join(self.src, "home"), exist_ok=True)
+        os.chmod(os.path.join(self.src, "home"), 0o755)
+
+        _copy_tree(self.src, self.dst)
+
+        self.assertEqual(stat.S_IMODE(os.lstat(mount_point).st_mode), 0o700)
+        self._assert_same(os.path.join("home", "user"))
+
+
+if __name__ == "__main__":
+    unittest.main()
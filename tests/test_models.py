@@ -0,0 +1,39 @@
+"""Tests for helpers.models."""
+
+import unittest
+
+from helpers.models import SystemConfig
+
+
+def _config(**overrides: str) -> SystemConfig:
+    """Return a configuration that passes validation, with overrides."""
+    fields = {
+        "target_drive": "/dev/sda",
+        "user_fullname": "Test User",
+        "username": "tester",
+        "hostname": "testhost",
+    }
+    fields.update(overrides)
+    return SystemConfig(**fields)
+
+
+class SystemConfigSwapSizeTest(unittest.TestCase):
+    """SystemConfig.validate checks swap_size."""
+
+    def test_accepts_sizes_and_auto(self) -> None:
+        """Unit-suffixed sizes and "auto" are valid."""
+        for swap_size in ("auto", "4G", "512M"):
+            with self.subTest(swap_size=swap_size):
+                fields = [e.field for e in _config(swap_size=swap_size).validate()]
+                self.assertNotIn("swap_size", fields)
+
+    def test_rejects_shell_text(self) -> None:
+        """Anything but a size is reported against swap_size."""
+        for swap_size in ("", "4G; reboot", "$(id)", "4 G"):
+            with self.subTest(swap_size=swap_size):
+                fields = [e.field for e in _config(swap_size=swap_size).validate()]
+                self.assertIn("swap_size", fields)
+
+
+if __name__ == "__main__":
+    unittest.main()
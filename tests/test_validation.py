@@ -0,0 +1,56 @@
+"""Tests for helpers.validation."""
+
+import unittest
+
+from helpers.validation import validate_ip_address, validate_ip_addresses
+
+
+class ValidateIpAddressTest(unittest.TestCase):
+    """validate_ip_address accepts decimal dotted quads only."""
+
+    def test_leading_zero_octet_is_decimal(self) -> None:
+        """A leading-zero octet above 7 is decimal, not invalid octal."""
+        self.assertTrue(validate_ip_address("192.168.1.08"))
+
+    def test_leading_zero_first_octet_is_decimal(self) -> None:
+        """"010" is ten, so the address is accepted like 10.1.1.1."""
+        self.assertTrue(validate_ip_address("010.1.1.1"))
+        self.assertEqual(
+            validate_ip_address("010.1.1.1"), validate_ip_address("10.1.1.1")
+        )
+
+    def test_leading_zeros_do_not_hide_reserved_ranges(self) -> None:
+        """Zero-padded reserved first octets are still rejected."""
+        self.assertFalse(validate_ip_address("000.1.1.1"))
+        self.assertFalse(validate_ip_address("127.000.000.001"))
+
+    def test_rejects_malformed(self) -> None:
+        """Short, hex, oversized and padded forms are rejected."""
+        for ip_string in (
+            "",
+            "10.1.1",
+            "0x0a.1.1.1",
+            "10.1.1.256",
+            "0010.1.1.1",
+            "10.1.1.1 ",
+            "10..1.1",
+        ):
+            with self.subTest(ip_string=ip_string):
+                self.assertFalse(validate_ip_address(ip_string))
+
+
+class ValidateIpAddressesTest(unittest.TestCase):
+    """validate_ip_addresses applies validate_ip_address to each argument."""
+
+    def test_matches_single_validator(self) -> None:
+        """Results follow argument order and the single-address rules."""
+        ip_strings = ("192.168.1.08", "010.1.1.1", "127.0.0.1", "10.1.1")
+        self.assertEqual(
+            validate_ip_addresses(*ip_strings),
+            tuple(validate_ip_address(ip) for ip in ip_strings),
+        )
+        self.assertEqual(validate_ip_addresses(*ip_strings), (True, True, False, False))
+
+
+if __name__ == "__main__":
+    unittest.main()